@@ -88,8 +88,10 @@ class Domains():
             if not self.dry_run:
                 logging.info("create domain '%s'" % domain['name'])
                 resource = keystone.domains.create(**domain)
+                self.openstack.cache_id('domain', domain['name'], resource_id=resource.id)
         else:
             resource = result[0]
+            self.openstack.cache_id('domain', domain['name'], resource_id=resource.id)
             diff = DeepDiff(resource.to_dict(), domain, threshold_to_diff_deeper=0)
             if 'values_changed' in diff:
                 self.diffs[domain['name']].append(diff['values_changed'])
@@ -123,9 +123,9 @@ class Flavors():
                     logging.info(
                         "deleting flavor '%s' to re-create, since it differs '%s'" %
                         (flavor['name'], diff['values_changed']))
-                if not self.dry_run:
-                    resource.delete()
-                    create = True
+                    if not self.dry_run:
+                        resource.delete()
+                        create = True
 
             except novaexceptions.NotFound:
                 create = True
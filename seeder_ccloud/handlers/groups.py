@@ -31,7 +31,8 @@ def seed_groups_handler(memo: kopf.Memo, patch: kopf.Patch, new, old, name, anno
     try:
         starttime = time.perf_counter()
         changed = utils.get_changed_seeds(old, new)
-        diffs = Groups(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            diffs = Groups(memo['args'], memo['dry_run']).seed(changed)
         duration = timedelta(seconds=time.perf_counter()-starttime)
         utils.setStatusFields('groups', patch, 'seeded', duration=duration, diffs=diffs)
         logging.info('seeding {} groups done'.format(name))
@@ -78,8 +79,10 @@ class Groups():
             if not self.dry_run:
                 self.diffs[group['name']].append('create')
                 resource = keystone.groups.create(domain=domain_id, **group)
+                self.openstack.cache_id('group', domain_name, group['name'], resource_id=resource.id)
         else:
             resource = result[0]
+            self.openstack.cache_id('group', domain_name, group['name'], resource_id=resource.id)
             diff = DeepDiff(group, resource.to_dict(), threshold_to_diff_deeper=0)
             if 'values_changed' in diff:
                 logging.debug("group %s differs: '%s'" % (group['name'], diff))
@@ -99,12 +102,18 @@ class Groups():
 
 
     def resolve_group_members(self):
+        keystoneclient = self.openstack.get_keystoneclient()
+        keys = set()
+        for users in self.group_members.values():
+            for uid in users:
+                username, domain = uid.split('@')
+                keys.add((domain, username))
+        user_ids = self.openstack.get_user_ids(keys)
         for group, users in self.group_members.items():
             logging.debug("resolving group members %s %s" % (group, users))
-            keystoneclient = self.get_keystoneclient()
             for uid in users:
                 username, domain = uid.split('@')
-                user = self.get_user_id(domain, username, keystoneclient)
+                user = user_ids.get((domain, username))
                 if user:
                     try:
                         keystoneclient.users.check_in_group(user, group)
@@ -69,7 +69,8 @@ def seed_address_scopes_handler(memo: kopf.Memo, new, old, name, spec,
         if 'openstack' not in spec or 'address_scopes' not in spec['openstack']:
             pass
         changed = utils.get_changed_seeds(old, new)
-        Address_Scopes(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Address_Scopes(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError(f"error seeding {name}: {error}", delay=30)
 
@@ -128,9 +129,17 @@ class Address_Scopes():
             if not self.dry_run:
                 result = neutron.create_address_scope(body)
                 resource = result['address_scope']
+                self.openstack.verify_revision('address_scope', resource, scope)
         else:
             resource = result['address_scopes'][0]
-            diff = DeepDiff(resource, scope, threshold_to_diff_deeper=0)
+            if self.openstack.is_revision_verified('address_scope', resource, scope):
+                diff = {}
+                logging.debug(
+                    f"address-scope {project_name}/{scope['name']} unchanged since revision {resource['revision_number']}")
+            else:
+                diff = DeepDiff(resource, scope, threshold_to_diff_deeper=0)
+                if 'values_changed' not in diff:
+                    self.openstack.verify_revision('address_scope', resource, scope)
             if 'values_changed' in diff:
                 self.diffs[scope['name']].append(diff['values_changed'])
                 logging.info(
@@ -139,7 +148,8 @@ class Address_Scopes():
                 body['address_scope'].pop('tenant_id', None)
                 body['address_scope'].pop('ip_version', None)
                 if not self.dry_run:
-                    neutron.update_address_scope(resource['id'], body)
+                    resource = self.openstack.update_neutron_resource('address_scope', resource, body)
+                    self.openstack.verify_revision('address_scope', resource, scope)
 
         if subnet_pools and resource:
             self.diffs[scope['name'] + "_subnetpools"] = {}
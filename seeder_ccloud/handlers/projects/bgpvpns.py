@@ -42,7 +42,8 @@ def seed_bgpvpns_handler(memo: kopf.Memo, new, old, name, annotations, **_):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Bgpvpns(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Bgpvpns(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
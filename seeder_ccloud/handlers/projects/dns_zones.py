@@ -13,19 +13,57 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
-import logging, kopf
-from designateclient.v2 import client as designateclient
+import logging, kopf, re, time
 from seeder_ccloud import utils
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
 
 config = utils.Config()
 
+# a resource record line of a designate zone export: name [ttl] IN type data
+ZONE_FILE_RECORD = re.compile(r'^(\S+)\s+(?:(\d+)\s+)?IN\s+(\S+)\s+(.*)$')
+ZONE_EXPORT_TIMEOUT = 120
+ZONE_IMPORT_TIMEOUT = 300
+
+
+def render_zone_file(zone, recordsets):
+    """
+    render a zone and its recordsets as BIND zone file, for designate zone imports.
+    Only name, email and ttl of the zone are carried: designate replaces the
+    SOA (its mname is a placeholder) and NS records with its own, the
+    description is applied after the import and SECONDARY zones cannot be imported.
+    """
+    ttl = zone.get('ttl', 3600)
+    rname = zone['email'].replace('@', '.')
+    lines = ['$ORIGIN {}'.format(zone['name']), '$TTL {}'.format(ttl),
+             '{0} IN SOA {0} {1}. 1 3600 600 86400 {2}'.format(zone['name'], rname, ttl)]
+    for recordset in recordsets:
+        for record in recordset['records']:
+            lines.append(' '.join(str(part) for part in (
+                recordset['name'], recordset.get('ttl', ''), 'IN', recordset['type'], record) if part != ''))
+    return '\n'.join(lines) + '\n'
+
+
+def parse_zone_file(zone_file):
+    """ index the records of a designate zone export by (name, type) -> (ttl, set of records) """
+    recordsets = {}
+    for line in zone_file.splitlines():
+        match = ZONE_FILE_RECORD.match(line.strip())
+        if not match:
+            continue
+        name, ttl, type_, record = match.groups()
+        _, records = recordsets.setdefault((name, type_), (int(ttl) if ttl else None, set()))
+        records.add(record.strip())
+    return recordsets
+
+
 @kopf.on.validate(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.dns_zones')
 def validate(spec, dryrun, **_):
     dns_zones = spec.get('dns_zones', [])
     for dns_zone in dns_zones:
         if 'name' not in dns_zone or not dns_zone['name']:
             raise kopf.AdmissionError("dns_zone must have a name...")
+        if dns_zone.get('zone_file') and dns_zone.get('type', 'PRIMARY') != 'PRIMARY':
+            raise kopf.AdmissionError("dns_zone zone_file is only supported for PRIMARY zones")
 
 
 @kopf.on.update(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.dns_zones')
@@ -36,7 +74,8 @@ def seed_dns_zones_handler(memo: kopf.Memo, new, old, name, annotations, **_):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        DNS_Zones(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            DNS_Zones(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
@@ -48,8 +87,18 @@ class DNS_Zones():
 
 
     def seed(self, dns_zones):
+        # the zones of all projects are listed once per seed run
+        self.zone_index = None
         for dns_zone in dns_zones:
-            self._seed_endpoint(dns_zone)
+            self._seed_dns_zone(dns_zone)
+
+
+    def _get_zone_index(self, designate):
+        """ the zones of all projects, indexed by name (designate zone names are unique) """
+        if self.zone_index is None:
+            self.zone_index = {z['name']: z for z in
+                               self.openstack.iter_designate_resources(designate.zones.list)}
+        return self.zone_index
 
 
     def _seed_dns_zone(self, zone):
@@ -66,21 +115,34 @@ class DNS_Zones():
 
         designate = self.openstack.get_designateclient(project_id)
         recordsets = zone.pop('recordsets', None)
+        # opt-in for very large zones: diff against a zone export, create by zone import
+        zone_file = zone.pop('zone_file', False)
 
-        zone = self.sanitize(zone, (
+        zone = self.openstack.sanitize(zone, (
             'name', 'email', 'ttl', 'description', 'masters',
             'type'))
 
-        try:
-            resource = designate.zones.get(zone['name'])
-            for attr in list(zone.keys()):
-                if zone[attr] != resource.get(attr, ''):
-                    logging.info(
-                        "%s differs. update dns zone'%s/%s'" % (
-                            attr, project_name, zone['name']))
-                    designate.zones.update(resource['id'], zone)
-                    break
-        except designateclient.exceptions.NotFound:
+        zones = self._get_zone_index(designate)
+        resource = zones.get(zone['name'])
+        if resource and resource.get('project_id') != project_id:
+            raise Exception("dns zone %s already exists in project %s" % (zone['name'], resource.get('project_id')))
+        if resource:
+            update = {attr: value for attr, value in zone.items()
+                      if attr not in ('name', 'type') and value != resource.get(attr, '')}
+            if update:
+                logging.info(
+                    "%s differs. update dns zone'%s/%s'" % (
+                        sorted(update.keys()), project_name, zone['name']))
+                if not self.dry_run:
+                    resource = zones[zone['name']] = designate.zones.update(resource['id'], update)
+        elif zone_file:
+            if zone.get('type', 'PRIMARY') != 'PRIMARY':
+                raise Exception("dns zone %s: zone_file is only supported for PRIMARY zones" % zone['name'])
+            resource = self.import_dns_zone(zone, recordsets or [], designate)
+            if resource:
+                zones[zone['name']] = resource
+            return
+        else:
             logging.info(
                 "create dns zone '%s/%s'" % (
                     project_name, zone['name']))
@@ -88,30 +150,107 @@ class DNS_Zones():
             if 'type' in zone:
                 zone['type_'] = zone.pop('type')
             if not self.dry_run:
-                resource = designate.zones.create(zone.pop('name'),
-                                            **zone)
+                name = zone.pop('name')
+                resource = zones[name] = designate.zones.create(name, **zone)
+
+        if recordsets and resource and zone_file:
+            recordsets = self.get_changed_dns_zone_recordsets(resource, recordsets, designate)
+            if recordsets:
+                self.seed_dns_zone_recordsets(resource, recordsets, designate,
+                                              self.find_dns_zone_recordsets(resource, recordsets, designate))
+        elif recordsets and resource:
+            self.seed_dns_zone_recordsets(resource, recordsets, designate)
+
 
-        if recordsets:
-            self.seed_dns_zone_recordsets(resource, recordsets)
+    def import_dns_zone(self, zone, recordsets, designate):
+        """
+        create a designate zone with all its recordsets by a single zone import,
+        wait for it and apply the description, which the zone file does not carry
+        """
+        logging.info("import dns zone '%s' with %d recordsets" % (zone['name'], len(recordsets)))
+        if self.dry_run:
+            return None
+        record = designate.zone_imports.create(render_zone_file(zone, recordsets))
+        deadline = time.monotonic() + ZONE_IMPORT_TIMEOUT
+        while record['status'] == 'PENDING':
+            if time.monotonic() > deadline:
+                raise Exception("import %s of dns zone %s timed out" % (record['id'], zone['name']))
+            time.sleep(1)
+            record = designate.zone_imports.get_import_record(record['id'])
+        if record['status'] != 'COMPLETE':
+            raise Exception("import %s of dns zone %s failed: %s" % (record['id'], zone['name'], record.get('message')))
+        logging.info("dns zone '%s' imported by %s" % (zone['name'], record['id']))
 
+        if zone.get('description'):
+            return designate.zones.update(record['zone_id'], {'description': zone['description']})
+        return designate.zones.get(record['zone_id'])
 
-    def seed_dns_zone_recordsets(self, zone, recordsets, project_id):
+
+    def get_changed_dns_zone_recordsets(self, zone, recordsets, designate):
+        """
+        export a designate zone and return the seeded recordsets which differ
+        from it. Zone files do not carry descriptions, they are not compared.
+        """
+        current = parse_zone_file(self.export_dns_zone(zone, designate))
+        changed = []
+        for recordset in recordsets:
+            ttl, records = current.get((recordset.get('name'), recordset.get('type')), (None, None))
+            if records is None or set(recordset.get('records', [])) != records or \
+                    ('ttl' in recordset and recordset['ttl'] != ttl):
+                changed.append(recordset)
+        logging.info("dns zone %s: %d of %d recordsets differ from the zone export" % (
+            zone['name'], len(changed), len(recordsets)))
+        return changed
+
+
+    def export_dns_zone(self, zone, designate):
+        """ the zone file of a designate zone, via a zone export task """
+        export = designate.zone_exports.create(zone['id'])
+        try:
+            deadline = time.monotonic() + ZONE_EXPORT_TIMEOUT
+            while export['status'] == 'PENDING':
+                if time.monotonic() > deadline:
+                    raise Exception("export of dns zone %s timed out" % zone['name'])
+                time.sleep(1)
+                export = designate.zone_exports.get_export_record(export['id'])
+            if export['status'] != 'COMPLETE':
+                raise Exception("export of dns zone %s failed: %s" % (zone['name'], export.get('message')))
+            return designate.zone_exports.get_export(export['id'])
+        finally:
+            designate.zone_exports.delete(export['id'])
+
+
+    def find_dns_zone_recordsets(self, zone, recordsets, designate):
+        """ the existing recordsets of a zone with the (name, type) of a few seeded ones """
+        current = {}
+        for recordset in recordsets:
+            if not recordset.get('name') or not recordset.get('type'):
+                continue
+            query = {'name': recordset['name'], 'type': recordset['type']}
+            for resource in designate.recordsets.list(zone['id'], criterion=query):
+                current[(resource['name'], resource['type'])] = resource
+        return current
+
+
+    def seed_dns_zone_recordsets(self, zone, recordsets, designate, current=None):
         """
         seed a designate zones recordsets
         :param zone:
         :param recordsets:
         :param designate:
+        :param current: existing recordsets by (name, type), listed if not given
         :return:
         """
 
         logging.debug("seeding recordsets of dns zones %s" % zone['name'])
 
-        designate = self.openstack.get_designateclient(project_id)
+        # list the recordsets of the zone once, indexed by (name, type)
+        if current is None:
+            current = {(r['name'], r['type']): r for r in
+                       self.openstack.iter_designate_resources(designate.recordsets.list, zone['id'])}
 
         for recordset in recordsets:
             try:
-                # records = recordset.pop('records', None)
-
                 recordset = self.openstack.sanitize(recordset, (
                     'name', 'ttl', 'description', 'type', 'records'))
 
@@ -126,46 +265,36 @@ class DNS_Zones():
                             recordset, zone['name']))
                     continue
 
-                query = {'name': recordset['name'],
-                        'type': recordset['type']}
-                result = designate.recordsets.list(zone['id'],
-                                                criterion=query)
-                if not result:
+                resource = current.get((recordset['name'], recordset['type']))
+                if not resource:
                     logging.info(
                         "create dns zones %s recordset %s" % (
                             zone['name'], recordset['name']))
-                    designate.recordsets.create(zone['id'],
-                                                recordset['name'],
-                                                recordset['type'],
-                                                recordset['records'],
-                                                description=recordset.get(
-                                                    'description'),
-                                                ttl=recordset.get('ttl'))
-                else:
-                    resource = result[0]
-                    for attr in list(recordset.keys()):
-                        if attr == 'records':
-                            for record in recordset['records']:
-                                if record not in resource.get('records',
-                                                            []):
-                                    logging.info(
-                                        "update dns zone %s recordset %s record %s" % (
-                                            zone['name'], recordset['name'],
-                                            record))
-                                    designate.recordsets.update(zone['id'],
-                                                                resource['id'],
-                                                                recordset)
-                                    break
-                        elif recordset[attr] != resource.get(attr, ''):
-                            logging.info(
-                                "%s differs. update dns zone'%s recordset %s'" % (
-                                    attr, zone['name'], recordset['name']))
-                            designate.recordsets.update(zone['id'],
-                                                        resource['id'],
-                                                        recordset)
-                            break
+                    if not self.dry_run:
+                        designate.recordsets.create(zone['id'],
+                                                    recordset['name'],
+                                                    recordset['type'],
+                                                    recordset['records'],
+                                                    description=recordset.get(
+                                                        'description'),
+                                                    ttl=recordset.get('ttl'))
+                    continue
+
+                # the order of the records does not matter
+                update = {}
+                for attr in ('ttl', 'description'):
+                    if attr in recordset and recordset[attr] != resource.get(attr):
+                        update[attr] = recordset[attr]
+                if 'records' in recordset and set(recordset['records']) != set(resource.get('records', [])):
+                    update['records'] = recordset['records']
+                if update:
+                    logging.info(
+                        "%s differs. update dns zone'%s recordset %s'" % (
+                            sorted(update.keys()), zone['name'], recordset['name']))
+                    if not self.dry_run:
+                        designate.recordsets.update(zone['id'], resource['id'], update)
 
             except Exception as e:
                 logging.error(
                     "could not seed dns zone %s recordsets: %s" % (
-                        zone['name'], e))
\ No newline at end of file
+                        zone['name'], e))
@@ -14,7 +14,6 @@
  limitations under the License.
 """
 import logging, kopf
-from keystoneclient import exceptions
 from seeder_ccloud import utils
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
 
@@ -28,7 +27,8 @@ def seed_endpoints_handler(memo: kopf.Memo, new, old, name, annotations, **_):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Endpoints(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Endpoints(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
@@ -40,6 +40,10 @@ class Endpoints():
 
 
     def seed(self, endpoints):
+        # endpoints already associated with a project, listed once per project
+        self.project_endpoints = {}
+        # the catalog is listed fresh once per seed run, it might have changed since it was cached
+        self.openstack.invalidate_service_catalog()
         for endpoint in endpoints:
             self._seed_endpoint(endpoint)
 
@@ -47,52 +51,49 @@ class Endpoints():
     def _seed_endpoint(self, endpoint):
         """ seed a keystone projects endpoints (OS-EP-FILTER)"""
         logging.debug(
-            "seeding project endpoint %s %s" % (endpoint.name, endpoint))
+            "seeding project endpoint %s" % endpoint)
 
         project_name = endpoint['project']
         project_id = self.openstack.get_project_id(endpoint['domain'], project_name)
         keystone = self.openstack.get_keystoneclient()
 
+        catalog = self.openstack.get_service_catalog()
         if 'endpoint_id' in endpoint:
-            try:
-                ep = keystone.endpoints.find(id=endpoint['endpoint_id'])
-                try:
-                    keystone.endpoint_filter.check_endpoint_in_project(
-                        project_id,
-                        ep)
-                except exceptions.NotFound:
-                    logging.info(
-                        "add project endpoint '%s %s'" % (
-                            project_name, ep))
-                    keystone.endpoint_filter.add_endpoint_to_project(
-                        project_id,
-                        ep)
-            except exceptions.NotFound as e:
+            endpoints = [ep for ep in catalog['endpoints'] if ep.id == endpoint['endpoint_id']]
+            if not endpoints:
                 raise Exception(
-                    'could not configure project endpoints for %s: endpoint %s not found: %s' % (
-                        project_name, endpoint, e))
+                    'could not configure project endpoints for %s: endpoint %s not found' % (
+                        project_name, endpoint))
         else:
-            try:
-                svc = keystone.services.find(name=endpoint['service'])
-                result = keystone.endpoints.list(service=svc.id,
-                                                region_id=endpoint[
-                                                    'region'])
-                for ep in result:
-                    try:
-                        keystone.endpoint_filter.check_endpoint_in_project(
-                            project_id, ep)
-                    except exceptions.NotFound:
-                        logging.info(
-                            "add project endpoint '%s %s'" % (
-                                project_name, ep))
-                        keystone.endpoint_filter.add_endpoint_to_project(
-                            project_id,
-                            ep)
-                    except Exception as e:
-                        raise Exception(
-                            'could not configure project endpoints for %s: endpoint %s not found: %s' % (
-                                project_name, ep, e))
-            except exceptions.NotFound as e:
+            services = [svc for svc in catalog['services'] if svc.name == endpoint['service']]
+            if not services:
                 raise Exception(
-                    'could not configure project endpoints for %s: service %s not found: %s' % (
-                        project_name, endpoint, e))
\ No newline at end of file
+                    'could not configure project endpoints for %s: service %s not found' % (
+                        project_name, endpoint))
+            endpoints = [ep for ep in catalog['endpoints']
+                         if ep.service_id == services[0].id and ep.region_id == endpoint['region']]
+            if not endpoints:
+                logging.warn(
+                    "skipping project endpoint %s of %s: service has no endpoints in region %s" % (
+                        endpoint, project_name, endpoint['region']))
+                return
+
+        if project_id not in self.project_endpoints:
+            self.project_endpoints[project_id] = {
+                ep.id for ep in keystone.endpoint_filter.list_endpoints_for_project(project_id)}
+        associated = self.project_endpoints[project_id]
+
+        for ep in endpoints:
+            if ep.id in associated:
+                continue
+            logging.info(
+                "add project endpoint '%s %s'" % (
+                    project_name, ep))
+            if not self.dry_run:
+                try:
+                    keystone.endpoint_filter.add_endpoint_to_project(project_id, ep)
+                except Exception as e:
+                    raise Exception(
+                        'could not configure project endpoints for %s: endpoint %s: %s' % (
+                            project_name, ep, e))
+            associated.add(ep.id)
@@ -59,7 +59,8 @@ def seed_network_quotas_handler(memo: kopf.Memo, new, old, name, annotations,
                                   delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Network_Quotas(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Network_Quotas(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error),
                                   delay=30)
@@ -74,10 +75,8 @@ class Network_Quotas():
     def seed(self, network_quotas):
         self.diffs = {}
 
-        keystone = self.openstack.get_keystoneclient()
-        limes = keystone.services.list(name='limes')
         # only seed network quota if limes is not available
-        if len(limes):
+        if self.openstack.has_service('limes'):
             logging.info(
                 "network_quotas will not be seeded when Limes service is available in that region"
             )
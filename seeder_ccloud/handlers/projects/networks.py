@@ -70,7 +70,8 @@ def seed_networks_handler(memo: kopf.Memo, patch: kopf.Patch, new, old, name, an
     try:
         starttime = time.perf_counter()
         changed = utils.get_changed_seeds(old, new)
-        Networks(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Networks(memo['args'], memo['dry_run']).seed(changed)
         duration = timedelta(seconds=time.perf_counter()-starttime)
         patch.status['state'] = "seeded"
         patch.spec['duration'] = str(duration)
@@ -141,45 +142,33 @@ class Networks():
             if not self.dry_run:
                 result = neutron.create_network(body)
                 resource = result['network']
+                self.openstack.cache_id('network', project_id, network['name'], resource_id=resource['id'])
+                self.openstack.verify_revision('network', resource, network)
         else:
             resource = result['networks'][0]
-            diff = DeepDiff(resource, network, threshold_to_diff_deeper=0)
-            if 'values_changed' in diff:
-                self.diffs[network['name']].append(diff['values_changed'])
-                logging.debug(f"network {network['name']} differs: {diff}")
+            self.openstack.cache_id('network', project_id, network['name'], resource_id=resource['id'])
+            if self.openstack.is_revision_verified('network', resource, network):
+                logging.debug(f"network {network['name']} unchanged since revision {resource['revision_number']}")
+            else:
+                diff = DeepDiff(resource, network, threshold_to_diff_deeper=0)
+                if 'values_changed' in diff:
+                    self.diffs[network['name']].append(diff['values_changed'])
+                    logging.debug(f"network {network['name']} differs: {diff}")
 
-                body['network'].pop('tenant_id', None)
-                if not self.dry_run:
-                    neutron.update_network(resource['id'], body)
+                    body['network'].pop('tenant_id', None)
+                    if not self.dry_run:
+                        resource = self.openstack.update_neutron_resource('network', resource, body)
+                        self.openstack.verify_revision('network', resource, network)
+                else:
+                    self.openstack.verify_revision('network', resource, network)
 
         if tags and resource:
-            self._seed_network_tags(resource, tags)
+            for tag in self.openstack.seed_neutron_tags('network', resource, tags, self.dry_run):
+                self.diffs[network['name']].append(f"create tag: {tag}")
 
         if subnets and resource:
             self._seed_network_subnets(resource, subnets)
 
-    def _seed_network_tags(self, network, tags):
-        """
-            seed neutron tags of a network
-            :param network:
-            :param tags:
-            :param args:
-            :param sess:
-            :return:
-            """
-
-        logging.debug(f"seeding tags of network {network['name']}")
-
-        # grab a neutron client
-        neutron = self.openstack.get_neutronclient()
-
-        for tag in tags:
-            if tag not in network['tags']:
-                self.diffs[network['name']].append(f"create tag: {tag}")
-                logging.debug(f"adding tag {tag} to network {network['name']}")
-                if not self.dry_run:
-                    neutron.add_tag('networks', network['id'], tag)
-
     def _seed_network_subnets(self, network, subnets):
         """
         seed neutron subnets of a network
@@ -230,9 +219,18 @@ class Networks():
                 logging.debug(
                     f"create subnet {network['name']}/{subnet['name']}")
                 if not self.dry_run:
-                    neutron.create_subnet(body)
+                    result = neutron.create_subnet(body)
+                    self.openstack.cache_id('subnet', network['tenant_id'], subnet['name'],
+                                            resource_id=result['subnet']['id'])
+                    self.openstack.verify_revision('subnet', result['subnet'], subnet)
             else:
                 resource = result['subnets'][0]
+                self.openstack.cache_id('subnet', network['tenant_id'], subnet['name'],
+                                        resource_id=resource['id'])
+                if self.openstack.is_revision_verified('subnet', resource, subnet):
+                    logging.debug(
+                        f"network {network['name']} subnet {subnet['name']} unchanged since revision {resource['revision_number']}")
+                    continue
                 diff = DeepDiff(resource, subnet, threshold_to_diff_deeper=0)
                 if 'values_changed' in diff:
                     self.diffs[network['name'] + '_subnet'].append(
@@ -249,4 +247,7 @@ class Networks():
                         body['subnet'].pop('subnetpool_id', None)
                         body['subnet'].pop('ip_version', None)
                         body['subnet'].pop('prefixlen', None)
-                        neutron.update_subnet(resource['id'], body)
+                        resource = self.openstack.update_neutron_resource('subnet', resource, body)
+                        self.openstack.verify_revision('subnet', resource, subnet)
+                else:
+                    self.openstack.verify_revision('subnet', resource, subnet)
@@ -20,6 +20,8 @@ from designateclient.v2 import client as designateclient
 from deepdiff import DeepDiff
 from seeder_ccloud import utils
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.openstack.share_type_catalog import ShareTypeCatalog
+from seeder_ccloud.openstack.flavor_catalog import FlavorCatalog
 
 config = utils.Config()
 
@@ -39,7 +41,8 @@ def seed_projects_handler(memo: kopf.Memo, new, old, name, annotations, **_):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Projects(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Projects(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
@@ -51,8 +54,13 @@ class Projects():
 
 
     def seed(self, projects):
+        self.share_type_catalog = None
+        # flavors are granted for all projects of the seed at once
+        self.project_flavors = []
         for project in projects:
             self._seed_projects(project)
+        if self.project_flavors:
+            self.seed_project_flavors(self.project_flavors)
 
 
     def _seed_projects(self, project):
@@ -80,8 +88,7 @@ class Projects():
 
             # resolve parent project if specified
             if 'parent' in project:
-                parent_id = self.openstack.get_project_id(domain_name, project['parent'],
-                                        keystone)
+                parent_id = self.openstack.get_project_id(domain_name, project['parent'])
                 if not parent_id:
                     logging.warn(
                         "skipping project '%s/%s', since its parent project is missing" % (
@@ -101,8 +108,10 @@ class Projects():
                 if not self.dry_run:
                     resource = keystone.projects.create(domain=domain_id,
                                                     **project)
+                    self.openstack.cache_id('project', domain_name, project['name'], resource_id=resource.id)
             else:
                 resource = result[0]
+                self.openstack.cache_id('project', domain_name, project['name'], resource_id=resource.id)
                 diff = DeepDiff(project, resource.to_dict(), threshold_to_diff_deeper=0)
                 if 'values_changed' in diff:
                     logging.debug("project %s differs: '%s'" % (project['name'], diff))
@@ -111,9 +120,8 @@ class Projects():
 
             # seed designate quota
             if dns_quota:
-                limes = keystone.services.list(name='limes')
                 # only seed dns quota if limes is not available
-                if not len(limes):
+                if not self.openstack.has_service('limes'):
                     self.seed_project_designate_quota(resource, dns_quota)
 
             # seed designate tsig keys
@@ -121,43 +129,64 @@ class Projects():
                 self.seed_project_tsig_keys(resource, dns_tsig_keys)
 
             if ec2_creds:
-                self.seed_project_ec2_creds(resource, domain_id, ec2_creds)
+                self.seed_project_ec2_creds(resource, domain_name, ec2_creds)
             
             if share_types:
                 self.seed_project_share_types(resource, share_types)
 
             # seed flavors
             if flavors:
-                self.seed_project_flavors(resource, flavors)
+                self.project_flavors.append((resource, flavors))
     
 
-    def seed_project_flavors(self, project, flavors):
+    def seed_project_flavors(self, project_flavors):
         """
-        seed a projects compute flavors
+        seed the compute flavors of projects
+        :param project_flavors: list of (project, flavor-ids)
         """
 
-        logging.debug("seeding flavors of project %s" % project.name)
+        logging.debug("seeding flavors of %d projects" % len(project_flavors))
 
-        # grab a nova client
-        nova = self.openstack.get_novaclient()
-        for flavorid in flavors:
-            try:
+        # list the flavors once, and the access of each private flavor once
+        catalog = FlavorCatalog(self.openstack.get_novaclient())
+        grants = {}
+        missing = []
+        for project, flavors in project_flavors:
+            for flavorid in flavors:
+                # flavor-ids are strings, the spec might carry plain numbers
+                flavorid = str(flavorid)
                 # validate flavor-id
-                nova.flavors.get(flavorid)
-                # check if project has access
-                access = set([a.tenant_id for a in
-                            nova.flavor_access.list(flavor=flavorid)])
-                if project.id not in access:
-                    # add it
-                    logging.info(
-                        "adding flavor '%s' access to project '%s" % (flavorid, project.name))
-                    nova.flavor_access.add_tenant_access(flavorid, project.id)
+                flavor = catalog.get(flavorid)
+                if not flavor:
+                    logging.error("could not add flavor-id '%s' access for project '%s': flavor not found" % (
+                        flavorid, project.name))
+                    missing.append("%s/%s" % (project.name, flavorid))
+                    continue
+                if getattr(flavor, 'is_public', False):
+                    logging.debug("flavor '%s' is public, project '%s' has access" % (flavorid, project.name))
+                    continue
+                grants[(flavorid, project.id)] = project
+
+        for (flavorid, project_id), project in sorted(grants.items(), key=lambda grant: grant[0]):
+            if project_id in catalog.projects(flavorid):
+                continue
+            # add it
+            logging.info(
+                "adding flavor '%s' access to project '%s" % (flavorid, project.name))
+            if self.dry_run:
+                continue
+            try:
+                catalog.add_project_access(flavorid, project.id)
             except Exception as e:
                 logging.error(
                     "could not add flavor-id '%s' access for project '%s': %s" % (
                         flavorid, project.name, e))
                 raise
 
+        # the missing flavors might be created later, retry them
+        if missing:
+            raise Exception("could not add flavor access, flavor not found: %s" % ', '.join(missing))
+
 
     def seed_project_designate_quota(self, project, config):
         """
@@ -275,22 +304,21 @@ class Projects():
                 logging.error("Could not seed ec2 credentials")
 
 
-    def seed_project_share_types(self, project, share_types, args, sess):
+    def seed_project_share_types(self, project, share_types):
         """
         seed a project share types
         """
-        # intialize manila client
-        try:
-            client = self.openstack.get_manilaclient()
-            shareTypeManager = client.share_types
-            shareTypeAccessManager = client.share_type_access
-        except Exception as e:
-            logging.error("Fail to initialize manila client: %s" % e)
-            raise
+        # list the share types and their access once per seed run
+        if self.share_type_catalog is None:
+            try:
+                client = self.openstack.get_manilaclient()
+            except Exception as e:
+                logging.error("Fail to initialize manila client: %s" % e)
+                raise
+            self.share_type_catalog = ShareTypeCatalog(client)
+        catalog = self.share_type_catalog
 
-        all_private_share_types = [t for t in shareTypeManager.list()
-                                if t.is_public is False]
-        validated_types = [t for t in all_private_share_types
+        validated_types = [t for t in catalog.private_types()
                         if t.name in share_types]
         validated_type_names = [t.name for t in validated_types]
 
@@ -300,11 +328,7 @@ class Projects():
 
         logging.info('Assign %s to project %s', validated_types, project.id)
 
-        def list_type_projects(stype):
-            return [l.project_id for l in shareTypeAccessManager.list(stype)]
-
-        current_types = [t for t in all_private_share_types
-                        if project.id in list_type_projects(t)]
+        current_types = catalog.types_of_project(project.id)
 
         logging.info(current_types)
 
@@ -314,7 +338,9 @@ class Projects():
         logging.info('add share types %s' % to_add)
         logging.info('remove share types %s' % to_remove)
 
+        if self.dry_run:
+            return
         for t in to_remove:
-            shareTypeAccessManager.remove_project_access(t, project.id)
+            catalog.remove_project_access(t, project.id)
         for t in to_add:
-            shareTypeAccessManager.add_project_access(t, project.id)
+            catalog.add_project_access(t, project.id)
@@ -36,7 +36,8 @@ def seed_routers_handler(memo: kopf.Memo, new, old, name, annotations, **_):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Routers(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Routers(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
@@ -174,11 +175,18 @@ class Routers():
                 if not self.dry_run:
                     result = neutron.create_router(body)
                     resource = result['router']
+                    self.openstack.verify_revision('router', resource, router)
             else:
                 resource = result['routers'][0]
                 update = False
-
-                for attr in list(router.keys()):
+                verified = self.openstack.is_revision_verified('router', resource, router)
+                if verified:
+                    logging.debug("router '%s/%s' unchanged since revision %s" % (
+                        project_name, router['name'], resource['revision_number']))
+
+                # compare the attributes only if the router changed since it was verified
+                attrs = [] if verified else list(router.keys())
+                for attr in attrs:
                     if attr == 'external_gateway_info':
                         if 'network_id' in router[attr] and resource.get(attr, ''):
                             if router[attr]['network_id'] != \
@@ -202,8 +210,10 @@ class Routers():
                     # drop read-only attributes
                     body['router'].pop('tenant_id', None)
                     if not self.dry_run:
-                        result = neutron.update_router(resource['id'], body)
-                        resource = result['router']
+                        resource = self.openstack.update_neutron_resource('router', resource, body)
+                        self.openstack.verify_revision('router', resource, router)
+                elif not verified:
+                    self.openstack.verify_revision('router', resource, router)
 
             if interfaces:
                 self.seed_router_interfaces(resource, interfaces)
@@ -226,6 +236,16 @@ class Routers():
         logging.debug("seeding interfaces of router %s" % router['name'])
         neutron = self.openstack.get_neutronclient()
 
+        # list the routers ports once, indexed by port-id and subnet-id
+        configured = set()
+        ports = self.openstack.iter_neutron_resources('ports', fields=['id', 'fixed_ips'],
+                                                      device_id=router['id'])
+        for port in ports:
+            configured.add(('port_id', port['id']))
+            for ip in port['fixed_ips']:
+                if 'subnet_id' in ip:
+                    configured.add(('subnet_id', ip['subnet_id']))
+
         for interface in interfaces:
             if 'subnet' in interface:
                 subnet_id = None
@@ -250,28 +270,14 @@ class Routers():
                 raise Exception("router interface '%s/%s', is misconfigured" % (
                         router['name'], interface))
 
-            # check if the interface is already configured for the router
-            query = {'device_id': router['id']}
-            result = neutron.list_ports(retrieve_all=True, **query)
-            found = False
-            for port in result['ports']:
-                if 'port_id' in interface and port['id'] == interface['port_id']:
-                    found = True
-                    break
-                elif 'subnet_id' in interface:
-                    for ip in port['fixed_ips']:
-                        if 'subnet_id' in ip and ip['subnet_id'] == \
-                                interface['subnet_id']:
-                            found = True
-                            break
-                if found:
-                    break
-
-            if found:
+            # the interface is configured, if its port or subnet is
+            keys = set(interface.items())
+            if keys & configured:
                 continue
 
             # add router interface
             if not self.dry_run:
                 neutron.add_interface_router(router['id'], interface)
+            configured.update(keys)
             logging.info("added interface %s to router'%s'" % (
                 interface, router['name']))
\ No newline at end of file
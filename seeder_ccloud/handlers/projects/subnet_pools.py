@@ -50,7 +50,8 @@ def seed_subnet_pools_handler(memo: kopf.Memo, new, old, name, annotations, **_)
         raise kopf.TemporaryError(f"error seeding {name}: dependencies error", delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Subnet_Pools(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Subnet_Pools(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError(f"error seeding {name}: {error}", delay=30)
 
@@ -95,51 +96,47 @@ class Subnet_Pools():
             self.diffs[subnet_pool['name']].append('create')
             if not self.dry_run:
                 result = neutron.create_subnetpool(body)
-                resource = result['subnetpools'][0]
+                resource = result['subnetpool']
+                self.openstack.cache_id('subnetpool', project_id, subnet_pool['name'], resource_id=resource['id'])
+                self.openstack.verify_revision('subnetpool', resource, subnet_pool)
         else:
             resource = result['subnetpools'][0]
-            diff = DeepDiff(resource.get('prefixes', []), subnet_pool.get('prefixes', []), threshold_to_diff_deeper=0)
-            if diff:
-                self.diffs[subnet_pool['name']].append(f"{list(diff.keys())[0]}: {list(diff.values())[0]}")
-                logging.info(f"subnetpool {subnet_pool['name']} differs: {diff}")
-
-            for attr in list(subnet_pool.keys()):
-                if attr != 'prefixes':
-                    # https://github.com/seperman/deepdiff/issues/180
-                    # a hacky comparison due to the neutron api not dealing with string/int attributes consistently
-                    if str(subnet_pool[attr]) != str(resource.get(attr, '')):
-                        logging.info(f"subnet_pool {subnet_pool['name']} differs: {attr}")
-                        self.diffs[subnet_pool['name']].append(f"value_changed: {attr}")
-
-            if self.diffs[subnet_pool['name']]:
-                if not self.dry_run:
-                    # drop read-only attributes
-                    body['subnetpool'].pop('tenant_id', None)
-                    body['subnetpool'].pop('shared', None)
-                    neutron.update_subnetpool(resource['id'], body)
-        
+            self.openstack.cache_id('subnetpool', project_id, subnet_pool['name'], resource_id=resource['id'])
+            if self.openstack.is_revision_verified('subnetpool', resource, subnet_pool):
+                logging.debug(f"subnetpool {subnet_pool['name']} unchanged since revision {resource['revision_number']}")
+            else:
+                resource = self._update_subnet_pool(resource, subnet_pool, body)
+
         if tags and resource:
-            self._seed_subnet_pool_tags(resource, tags)
+            for tag in self.openstack.seed_neutron_tags('subnetpool', resource, tags, self.dry_run):
+                self.diffs[subnet_pool['name']].append(f"create tag: {tag}")
 
 
-    def _seed_subnet_pool_tags(self, subnet_pool, tags):
+    def _update_subnet_pool(self, resource, subnet_pool, body):
         """
-            seed neutron tags of a subnet_pool
-            :param network:
-            :param tags:
-            :param args:
-            :param sess:
-            :return:
-            """
-
-        logging.debug(f"seeding tags of subnet_pool {subnet_pool['name']}")
-
-        # grab a neutron client
-        neutron = self.openstack.get_neutronclient()
-
-        for tag in tags:
-            if tag not in subnet_pool['tags']:
-                self.diffs[subnet_pool['name']].append(f"create tag: {tag}")
-                logging.debug(f"adding tag {tag} to subnet_pool {subnet_pool['name']}")
-                if not self.dry_run:
-                    neutron.add_tag('subnetpools', subnet_pool['id'], tag)
+        compare an existing subnet_pool with its seed and update it, if it differs
+        :return: the (updated) subnet_pool
+        """
+        diff = DeepDiff(resource.get('prefixes', []), subnet_pool.get('prefixes', []), threshold_to_diff_deeper=0)
+        if diff:
+            self.diffs[subnet_pool['name']].append(f"{list(diff.keys())[0]}: {list(diff.values())[0]}")
+            logging.info(f"subnetpool {subnet_pool['name']} differs: {diff}")
+
+        for attr in list(subnet_pool.keys()):
+            if attr != 'prefixes':
+                # https://github.com/seperman/deepdiff/issues/180
+                # a hacky comparison due to the neutron api not dealing with string/int attributes consistently
+                if str(subnet_pool[attr]) != str(resource.get(attr, '')):
+                    logging.info(f"subnet_pool {subnet_pool['name']} differs: {attr}")
+                    self.diffs[subnet_pool['name']].append(f"value_changed: {attr}")
+
+        if self.diffs[subnet_pool['name']]:
+            if not self.dry_run:
+                # drop read-only attributes
+                body['subnetpool'].pop('tenant_id', None)
+                body['subnetpool'].pop('shared', None)
+                resource = self.openstack.update_neutron_resource('subnetpool', resource, body)
+                self.openstack.verify_revision('subnetpool', resource, subnet_pool)
+        else:
+            self.openstack.verify_revision('subnetpool', resource, subnet_pool)
+        return resource
@@ -14,11 +14,11 @@
  limitations under the License.
 """
 
-import logging, kopf
+import logging, kopf, threading
+from concurrent.futures import ThreadPoolExecutor
 from seeder_ccloud import utils
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
 from swiftclient import client as swiftclient
-from keystoneclient import exceptions
 
 config = utils.Config()
 
@@ -30,12 +30,16 @@ def seed_swifts_handler(memo: kopf.Memo, new, old, name, annotations, **_):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Swift(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Swift(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
 
 class Swift():
+    # concurrent HEAD requests per project, to compare container metadata
+    container_workers = 8
+
     def __init__(self, args, dry_run=False):
         self.openstack = OpenstackHelper(args)
         self.dry_run = dry_run
@@ -60,28 +64,13 @@ class Swift():
             logging.debug(
                 "seeding swift account for project %s" % swift['project'])
 
+            project_name = swift['project']
             try:
-                project_id = self.openstack.get_project_id(swift['project'])
-                project_name = swift['project']
-                session = self.openstack.get_session()
-                service_token = session.get_token()
-
-                # poor mans storage-url generation
-                try:
-                    swift_endpoint = session.get_endpoint(
-                        service_type='object-store',
-                        interface=self.openstack.args.interface)
-                except exceptions.EndpointNotFound:
-                    swift_endpoint = session.get_endpoint(
-                        service_type='object-store',
-                        interface='admin')
-
-                storage_url = swift_endpoint.split('/AUTH_')[
-                                0] + '/AUTH_' + project_id
+                project_id = self.openstack.get_project_id(swift['domain'], project_name)
+                storage_url, service_token = self.openstack.get_swift_auth(project_id)
 
                 # Create swiftclient Connection
-                conn = swiftclient.Connection(session=session,
-                                            preauthurl=storage_url,
+                conn = swiftclient.Connection(preauthurl=storage_url,
                                             preauthtoken=service_token,
                                             insecure=True)
                 try:
@@ -118,35 +107,66 @@ class Swift():
         logging.debug(
             "seeding swift containers for project %s" % project)
 
+        # one account listing tells which containers exist
+        try:
+            _, listing = conn.get_account(full_listing=True)
+            existing = {c['name'] for c in listing}
+        except swiftclient.ClientException as e:
+            # the account might not exist yet, it is created with the first container
+            if e.http_status != 404:
+                raise
+            existing = set()
+
+        to_compare = []
         for container in containers:
-            try:
-                # prepare the container metadata
-                headers = {}
-                if 'metadata' in container:
-                    for meta in list(container['metadata'].keys()):
-                        header = 'x-container-%s' % meta
-                        headers[header] = str(container['metadata'][meta])
-                try:
-                    # see if the container already exists
-                    result = conn.head_container(container['name'])
-                    for header in list(headers.keys()):
-                        if headers[header] != result.get(header, ''):
-                            logging.info(
-                                "%s differs. update container %s/%s" % (
-                                    header, project,
-                                    container['name']))
-                            if not self.dry_run:
-                                conn.post_container(container['name'], headers)
-                            break
-                except swiftclient.ClientException:
-                    # nope, go create it
+            # prepare the container metadata
+            headers = {}
+            if 'metadata' in container:
+                for meta in list(container['metadata'].keys()):
+                    header = 'x-container-%s' % meta
+                    headers[header.lower()] = str(container['metadata'][meta])
+            if container['name'] not in existing:
+                logging.info(
+                    'creating swift container %s/%s' % (
+                        project, container['name']))
+                if not self.dry_run:
+                    try:
+                        conn.put_container(container['name'], headers)
+                    except Exception as e:
+                        logging.error(
+                            "could not seed swift container for project %s: %s" % (
+                                project, e))
+                        raise
+            elif headers:
+                to_compare.append((container['name'], headers))
+
+        if not to_compare:
+            return
+
+        # HEAD the existing containers with managed metadata concurrently,
+        # each worker with its own connection sharing the token
+        local = threading.local()
+        def update_container(name, headers):
+            if not hasattr(local, 'conn'):
+                local.conn = swiftclient.Connection(preauthurl=conn.url, preauthtoken=conn.token,
+                                                    insecure=True)
+            result = local.conn.head_container(name)
+            for header in list(headers.keys()):
+                if headers[header] != result.get(header, ''):
                     logging.info(
-                        'creating swift container %s/%s' % (
-                            project, container['name']))
+                        "%s differs. update container %s/%s" % (
+                            header, project, name))
                     if not self.dry_run:
-                        conn.put_container(container['name'], headers)
-            except Exception as e:
-                logging.error(
-                    "could not seed swift container for project %s: %s" % (
-                        project, e))
-                raise
\ No newline at end of file
+                        local.conn.post_container(name, headers)
+                    break
+
+        with ThreadPoolExecutor(max_workers=self.container_workers) as executor:
+            futures = [executor.submit(update_container, name, headers) for name, headers in to_compare]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(
+                        "could not seed swift container for project %s: %s" % (
+                            project, e))
+                    raise
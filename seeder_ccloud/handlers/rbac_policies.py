@@ -17,7 +17,6 @@
 import logging, re, kopf
 from seeder_ccloud import utils
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
-from keystoneclient import exceptions
 
 config = utils.Config()
 
@@ -55,7 +54,8 @@ def seed_rbac_policies_handler(memo: kopf.Memo, new, old, name, annotations, **_
 
     try:
         changed = utils.get_changed_seeds(old, new)
-        Rbac_Policies(memo['args'], memo['dry_run']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Rbac_Policies(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
@@ -68,58 +68,96 @@ class Rbac_Policies():
 
 
     def seed(self, rbac_policies):
-        for rbac_policy in rbac_policies:
-            self._seed_rbac_policy(rbac_policy)
-
-
-    def _seed_rbac_policy(self, rbac):
-        """ seed a neutron rbac-policy """
-
-        logging.debug("seeding rbac-policy %s" % rbac)
-
-        # grab a neutron client
-        neutron = self.openstack.get_neutronclient()
-        rbac = self.openstack.sanitize(rbac, ('object_type', 'object_name', 'object_id', 'action', 'target_tenant_name', 'target_tenant'))
-
-        try:
-            # network@project@domain ?
+        rbac_policies = [self.openstack.sanitize(rbac, (
+            'object_type', 'object_name', 'object_id', 'action', 'target_tenant_name', 'target_tenant'))
+            for rbac in rbac_policies]
+        if not rbac_policies:
+            return
+
+        # resolve all referenced projects and networks in batch
+        names = []
+        for rbac in rbac_policies:
+            # network@project@domain, project@domain
+            object_name = re.match(object_name_regex, rbac['object_name'])
+            target_name = re.match(target_name_regex, rbac['target_tenant_name'])
+            names.append((object_name, target_name))
+        project_ids = self.openstack.get_project_ids(
+            {(m.group(3), m.group(2)) for m, _ in names if m} | {(m.group(2), m.group(1)) for _, m in names if m})
+        network_ids = self.openstack.get_network_ids(
+            {(project_ids[(m.group(3), m.group(2))], m.group(1)) for m, _ in names
+             if m and (m.group(3), m.group(2)) in project_ids})
+
+        policies = []
+        unresolved = []
+        for rbac, (object_name, target_name) in zip(rbac_policies, names):
             network_id = None
-            match = re.match(object_name_regex, rbac['object_name'])
-            if match:
-                project_id = self.openstack.get_project_id(match.group(3), match.group(2))
-                if project_id:
-                    network_id = self.openstack.get_network_id(project_id, match.group(1))
+            if object_name:
+                project_id = project_ids.get((object_name.group(3), object_name.group(2)))
+                network_id = network_ids.get((project_id, object_name.group(1)))
             if not network_id:
                 logging.warn("skipping rbac-policy '%s': could not locate object_name" % rbac)
-                return
+                unresolved.append(rbac['object_name'])
+                continue
             rbac['object_id'] = network_id
             rbac.pop('object_name', None)
 
-            # project@domain ?
             project_id = None
-            match = re.match(target_name_regex, rbac['target_tenant_name'])
-            if match:
-                project_id = self.openstack.get_project_id(match.group(2), match.group(1))
+            if target_name:
+                project_id = project_ids.get((target_name.group(2), target_name.group(1)))
             if not project_id:
                 logging.warn("skipping rbac-policy '%s': could not locate target_tenant_name" % rbac)
-                return
+                unresolved.append(rbac['target_tenant_name'])
+                continue
             rbac['target_tenant'] = project_id
             rbac.pop('target_tenant_name', None)
+            policies.append(rbac)
+
+        # list the existing policies once per object_type, for the seeded objects only
+        existing = set()
+        for object_type in {rbac['object_type'] for rbac in policies}:
+            existing |= self._list_rbac_policies(
+                object_type, {rbac['object_id'] for rbac in policies if rbac['object_type'] == object_type})
 
-            try:
-                query = {'object_id': rbac['object_id'], 'object_type': rbac['object_type'], 'action': rbac['action'],
-                        'target_tenant': rbac['target_tenant']}
-                result = neutron.list_rbac_policies(retrieve_all=True, **query)
-            except exceptions.NotFound:
-                result = None
+        for rbac in policies:
+            self._seed_rbac_policy(rbac, existing)
 
-            if not result or not result['rbac_policies']:
-                body = {'rbac_policy': rbac.copy()}
+        # the unresolved references might be created later, retry them
+        if unresolved:
+            raise Exception("could not seed rbac-policies, not found: %s" % ', '.join(unresolved))
 
-                logging.info("create rbac-policy '%s'" % rbac)
-                if not self.dry_run:
-                    neutron.create_rbac_policy(body=body)
 
+    def _list_rbac_policies(self, object_type, object_ids, chunk_size=100):
+        """ (object_type, object_id, action, target_tenant) of the rbac-policies of a set of objects """
+        existing = set()
+        object_ids = sorted(object_ids)
+        # keep the query strings short
+        for i in range(0, len(object_ids), chunk_size):
+            policies = self.openstack.iter_neutron_resources(
+                'rbac_policies', fields=['object_id', 'action', 'target_tenant'],
+                object_type=object_type, object_id=object_ids[i:i + chunk_size])
+            for policy in policies:
+                existing.add((object_type, policy['object_id'], policy['action'], policy['target_tenant']))
+        return existing
+
+
+    def _seed_rbac_policy(self, rbac, existing):
+        """ seed a neutron rbac-policy, unless it is in the set of existing policies """
+
+        logging.debug("seeding rbac-policy %s" % rbac)
+
+        key = (rbac['object_type'], rbac['object_id'], rbac['action'], rbac['target_tenant'])
+        if key in existing:
+            return
+
+        # grab a neutron client
+        neutron = self.openstack.get_neutronclient()
+        try:
+            body = {'rbac_policy': rbac.copy()}
+
+            logging.info("create rbac-policy '%s'" % rbac)
+            if not self.dry_run:
+                neutron.create_rbac_policy(body=body)
+            existing.add(key)
         except Exception as e:
             logging.error("could not seed rbac-policy %s: %s" % (rbac, e))
-            raise
\ No newline at end of file
+            raise
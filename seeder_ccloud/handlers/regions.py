@@ -15,6 +15,7 @@
 """
 
 import kopf, logging
+from concurrent.futures import ThreadPoolExecutor
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
 from seeder_ccloud import utils
 from deepdiff import DeepDiff
@@ -43,6 +44,9 @@ def seed_regions_handler(memo: kopf.Memo, new, old, name, annotations, **_):
 
 
 class Regions():
+    # concurrently seeded sibling regions
+    region_workers = 8
+
     def __init__(self, args, dry_run=False):
         self.dry_run = dry_run
         self.args = args
@@ -51,38 +55,57 @@ class Regions():
 
     def seed(self, regions):
         logging.info('seeding regions')
-        # seed parent regions
-        for region in regions:
-            if 'parent_region' not in region:
-                self._seed_region(region)
-        # seed child regions
+        regions = [self.openstack.sanitize(region, ('id', 'description', 'parent_region'))
+                   for region in regions]
+        existing = {r.id: r for r in self.openstack.get_keystoneclient().regions.list()}
+
+        # parents are seeded before their children, the regions of a level concurrently
+        for level in self._get_levels(regions):
+            with ThreadPoolExecutor(max_workers=self.region_workers) as executor:
+                for _ in executor.map(lambda region: self._seed_region(region, existing), level):
+                    pass
+
+
+    @staticmethod
+    def _get_levels(regions):
+        """
+        group regions by their depth in the region tree. Parent regions which
+        are not seeded are expected to exist already.
+        """
+        seeded = {region['id']: region for region in regions}
+        depths = {}
+
+        def depth(region, path=()):
+            if region['id'] in path:
+                raise Exception("region '%s' is its own ancestor" % region['id'])
+            if region['id'] not in depths:
+                parent = seeded.get(region.get('parent_region'))
+                depths[region['id']] = 0 if parent is None else depth(parent, path + (region['id'],)) + 1
+            return depths[region['id']]
+
+        levels = {}
         for region in regions:
-            if 'parent_region' in region:
-                self._seed_region(region)
+            levels.setdefault(depth(region), []).append(region)
+        return [levels[d] for d in sorted(levels)]
 
 
-    def _seed_region(self, region):
+    def _seed_region(self, region, existing):
         """ seed a keystone region """
         logging.debug("seeding region %s" % region)
 
-        region = self.openstack.sanitize(region,
-                        ('id', 'description', 'parent_region'))
-
-        try:
-            result = self.openstack.get_keystoneclient().regions.get(region['id'])
-        except self.openstack.get_keystoneclient().exception.NotFound:
-            result = None
-
+        keystone = self.openstack.get_keystoneclient()
+        result = existing.get(region['id'])
         if not result:
             logging.info("create region '%s'" % region['id'])
             if not self.dry_run:
-                self.openstack.get_keystoneclient().regions.create(**region)
+                existing[region['id']] = keystone.regions.create(**region)
         else:  # wtf: why can't they deal with parent_region(_id) consistently
             region_copy = region.copy()
             if 'parent_region' in region_copy:
                 region_copy['parent_region_id'] = region_copy.pop('parent_region')
             diff = DeepDiff(region_copy, result.to_dict())
             if 'values_changed' in diff:
-                logging.debug("region %s differs: '%s'" % (region['name'], diff))
+                logging.debug("region %s differs: '%s'" % (region['id'], diff))
                 if not self.dry_run:
-                    self.openstack.get_keystoneclient().regions.update(result.id, **region)
\ No newline at end of file
+                    update = {k: v for k, v in region.items() if k != 'id'}
+                    keystone.regions.update(result.id, **update)
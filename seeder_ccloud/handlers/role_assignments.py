@@ -55,7 +55,8 @@ def seed_role_assignments_handler(memo: kopf.Memo,  patch: kopf.Patch, new, old,
     try:
         starttime = time.perf_counter()
         changed = utils.get_changed_seeds(old, new)
-        Role_Assignments(memo['args']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Role_Assignments(memo['args']).seed(changed)
         duration = timedelta(seconds=time.perf_counter()-starttime)
         patch.status['state'] = "seeded"
         patch.spec['duration'] = str(duration)
@@ -71,10 +72,29 @@ class Role_Assignments():
 
 
     def seed(self, role_assignments):
+        self._resolve_ids(role_assignments)
         for role_assignment in role_assignments:
             self._seed_role_assignments(role_assignment)
 
 
+    def _resolve_ids(self, role_assignments):
+        """
+        resolve all referenced users, groups and projects in batches, so the
+        lookups of the single role assignments are served from the id cache
+        """
+        keys = {'user': set(), 'group': set(), 'project': set()}
+        for assignment in role_assignments:
+            for kind in keys:
+                if kind in assignment and 'domain' in assignment:
+                    keys[kind].add((assignment['domain'], assignment[kind]))
+        if keys['user']:
+            self.openstack.get_user_ids(keys['user'])
+        if keys['group']:
+            self.openstack.get_group_ids(keys['group'])
+        if keys['project']:
+            self.openstack.get_project_ids(keys['project'])
+
+
     def _seed_role_assignments(self, assignment):
         logging.debug("resolving role assignment %s" % assignment)
         keystone = self.openstack.get_keystoneclient()
@@ -15,7 +15,6 @@
 """
 
 import logging, kopf
-from keystoneclient import exceptions
 from seeder_ccloud import utils
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
 
@@ -40,7 +39,8 @@ def seed_role_inferences_handler(memo: kopf.Memo, new, old, name, annotations, *
 
     try:
         changed = utils.get_changed_seeds(old, new)
-        Role_Inferences(memo['args', memo['dry_run']]).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Role_Inferences(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
@@ -53,6 +53,11 @@ class Role_Inferences():
 
 
     def seed(self, role_inferences):
+        # list all inference rules once, indexed by (prior role name, implied role name)
+        self.existing = set()
+        for rule in self.openstack.get_keystoneclient().inference_rules.list_inference_roles():
+            for implied_role in rule.implies:
+                self.existing.add((rule.prior_role['name'], implied_role['name']))
         for role_inference in role_inferences:
             self._seed_role_inference(role_inference)
 
@@ -64,6 +69,8 @@ class Role_Inferences():
         # todo: role.domainId ? just for global roles?
 
         role_inference = self.openstack.sanitize(role_inference, ('prior_role', 'implied_role'))
+        if (role_inference['prior_role'], role_inference['implied_role']) in self.existing:
+            return
 
         # resolve role-id's
         prior_role_id = self.openstack.get_role_id(role_inference['prior_role'])
@@ -77,9 +84,7 @@ class Role_Inferences():
                 "skipping role-inference '%s', since its implied_role is unknown" % role_inference)
             return
 
-        try:
-            self.openstack.get_keystoneclient().inference_rules.get(prior_role_id, implied_role_id)
-        except exceptions.NotFound:
-            logging.info("create role-inference '%s'" % role_inference)
-            if not self.dry_run:
-                self.openstack.get_keystoneclient().inference_rules.create(prior_role_id, implied_role_id)
\ No newline at end of file
+        logging.info("create role-inference '%s'" % role_inference)
+        if not self.dry_run:
+            self.openstack.get_keystoneclient().inference_rules.create(prior_role_id, implied_role_id)
+        self.existing.add((role_inference['prior_role'], role_inference['implied_role']))
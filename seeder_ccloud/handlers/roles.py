@@ -72,6 +72,7 @@ class Roles():
             result = self.openstack.get_keystoneclient().roles.list(name=role['name'], domain=role['domainId'])
         else:
             result = self.openstack.get_keystoneclient().roles.list(name=role['name'])
+        resource = None
         if not result:
             logging.info("create role '%s'" % role)
             if not self.dry_run:
@@ -83,3 +84,7 @@ class Roles():
                 logging.debug("role %s differs: '%s'" % (role['name'], diff))
                 if not self.dry_run:
                     self.openstack.get_keystoneclient().roles.update(resource.id, **role)
+
+        # get_role_id only resolves global roles
+        if resource and 'domainId' not in role:
+            self.openstack.cache_id('role', role['name'], resource_id=resource.id)
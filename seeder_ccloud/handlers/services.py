@@ -50,10 +50,10 @@ def validate_services(spec, dryrun, **_):
                     raise kopf.AdmissionError("Endpoint region must be vaild if present..")
 
 
-@kopf.on.update(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.roles')
-@kopf.on.create(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.roles')
-def seed_roles_handler(memo: kopf.Memo, new, old, name, annotations, **_):
-    logging.info('seeding {} roles'.format(name))
+@kopf.on.update(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.services')
+@kopf.on.create(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.services')
+def seed_services_handler(memo: kopf.Memo, new, old, name, annotations, **_):
+    logging.info('seeding {} services'.format(name))
     if not config.is_dependency_successful(annotations):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
 
@@ -73,8 +73,17 @@ class Services():
 
     def seed(self, services):
         logging.info('seeding services')
-        for service in services:
-            self._seed_service(service)
+        # list services and endpoints once, indexed by (name, type) and (service, interface, region)
+        keystone = self.openstack.get_keystoneclient()
+        self.services = {(s.name, s.type): s for s in keystone.services.list() or []}
+        self.endpoints = {(e.service_id, e.interface, e.region_id): e for e in keystone.endpoints.list() or []}
+        self.changed = False
+        try:
+            for service in services:
+                self._seed_service(service)
+        finally:
+            if self.changed:
+                self.openstack.invalidate_service_catalog()
 
 
     def _seed_service(self, service):
@@ -84,23 +93,24 @@ class Services():
 
         service = self.openstack.sanitize(service,
                         ('type', 'name', 'enabled', 'description'))
-        result = self.openstack.get_keystoneclient().services.list(name=service['name'],
-                                        type=service['type'])
-        if not result:
+        resource = self.services.get((service['name'], service['type']))
+        if not resource:
             logging.info(
                 "create service '%s/%s'" % (
                     service['name'], service['type']))
             if not self.dry_run:
                 resource = self.openstack.get_keystoneclient().services.create(**service)
+                self.services[(service['name'], service['type'])] = resource
+                self.changed = True
         else:
-            resource = result[0]
             diff = DeepDiff(service, resource.to_dict(), threshold_to_diff_deeper=0)
             if 'values_changed' in diff:
                 logging.debug("endpoint %s differs: '%s'" % (service['name'], diff))
                 if not self.dry_run:
                     self.openstack.get_keystoneclient().services.update(resource.id, **service)
+                    self.changed = True
 
-        if endpoints:
+        if endpoints and resource:
             self.seed_endpoints(resource, endpoints)
 
 
@@ -112,19 +122,20 @@ class Services():
             endpoint = self.openstack.sanitize(endpoint, (
                 'interface', 'region', 'url', 'enabled', 'name'))
 
-            region = endpoint.get('region', None)
-            result = self.openstack.get_keystoneclient().endpoints.list(service=service.id,
-                                            interface=endpoint[
-                                                'interface'],
-                                            region_id=region)
-            if not result:
+            key = (service.id, endpoint['interface'], endpoint.get('region', None))
+            resource = self.endpoints.get(key)
+            if not resource:
                 logging.info("create endpoint '%s/%s'" % (
                     service.name, endpoint['interface']))
-                self.openstack.get_keystoneclient().endpoints.create(service.id, **endpoint)
+                if not self.dry_run:
+                    self.endpoints[key] = self.openstack.get_keystoneclient().endpoints.create(service.id, **endpoint)
+                    self.changed = True
             else:
-                resource = result[0]
-                diff = DeepDiff(resource, endpoint, threshold_to_diff_deeper=0)
-                if len(diff.keys()) > 0:
-                    logging.debug("endpoint %s differs: '%s'" % (endpoint['interface'], diff))
+                current = resource.to_dict()
+                update = {attr: value for attr, value in endpoint.items()
+                          if attr not in ('interface', 'region') and value != current.get(attr)}
+                if update:
+                    logging.debug("endpoint %s differs: '%s'" % (endpoint['interface'], sorted(update.keys())))
                     if not self.dry_run:
-                        self.openstack.get_keystoneclient().endpoints.update(resource.id, **endpoint)
+                        self.openstack.get_keystoneclient().endpoints.update(resource.id, **update)
+                        self.changed = True
@@ -14,24 +14,32 @@
  limitations under the License.
 """
 
-import logging, kopf
+import logging, kopf, time
+from datetime import timedelta, datetime
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.openstack.share_type_catalog import ShareTypeCatalog
 from seeder_ccloud import utils
 
 config = utils.Config()
 
 @kopf.on.update(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.share_types')
 @kopf.on.create(config.crd_info['plural'], annotations={'operatorVersion': config.operator_version}, field='spec.openstack.share_types')
-def seed_share_types_handler(memo: kopf.Memo, new, old, name, annotations, **_):
+def seed_share_types_handler(memo: kopf.Memo, patch: kopf.Patch, new, old, name, annotations, **_):
     logging.info('seeding {} share_types'.format(name))
     if not config.is_dependency_successful(annotations):
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
 
     try:
+        starttime = time.perf_counter()
         changed = utils.get_changed_seeds(old, new)
-        Share_Types(memo['args'], memo['dry_run']).seed(changed)
+        diffs = Share_Types(memo['args'], memo['dry_run']).seed(changed)
+        duration = timedelta(seconds=time.perf_counter()-starttime)
+        utils.setStatusFields('share_types', patch, 'seeded', duration=duration, diffs=diffs)
     except Exception as error:
+        utils.setStatusFields('share_types', patch, 'error', 0, latest_error=str(error))
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
+    finally:
+        patch.status['latest_reconcile'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
 
 
 class Share_Types():
@@ -43,8 +51,11 @@ class Share_Types():
 
     def seed(self, share_types):
         logging.info('seeding manila share_types')
+        self.catalog = None
+        self.diffs = {}
         for share_type in share_types:
             self._seed_share_types(share_type)
+        return self.diffs
 
 
     def _seed_share_types(self, share_type):
@@ -59,12 +70,9 @@ class Share_Types():
             logging.error("Fail to initialize client: %s" % e)
             raise
 
-        def get_type_by_name(name):
-            opts = {'all_tenants': 1}
-            for t in manager.list(search_opts=opts):
-                if t.name == name:
-                    return t
-            return None
+        # list the share types once per seed run
+        if self.catalog is None:
+            self.catalog = ShareTypeCatalog(client)
 
         def validate_share_type(sharetype):
             sharetype = self.openstack.sanitize(sharetype, [
@@ -77,12 +85,20 @@ class Share_Types():
             return sharetype
 
         def update_type(stype, extra_specs):
-            to_be_unset = []
-            for k in list(stype.extra_specs.keys()):
-                if k not in list(extra_specs.keys()):
-                    to_be_unset.append(k)
-            stype.unset_keys(to_be_unset)
-            stype.set_keys(extra_specs)
+            # manila returns all extra spec values as strings
+            current = self.catalog.get_extra_specs(stype)
+            to_be_unset = [k for k in current if k not in extra_specs]
+            to_be_set = {k: v for k, v in extra_specs.items() if str(v) != current.get(k)}
+            for k in to_be_unset:
+                self.diffs[stype.name].append('unset extra_spec: {}'.format(k))
+            for k in to_be_set:
+                self.diffs[stype.name].append('set extra_spec: {}'.format(k))
+            if self.dry_run:
+                return
+            if to_be_unset:
+                self.catalog.unset_extra_specs(stype, to_be_unset)
+            if to_be_set:
+                self.catalog.set_extra_specs(stype, to_be_set)
 
         def create_type(sharetype):
             extra_specs = sharetype['extra_specs']
@@ -98,28 +114,29 @@ class Share_Types():
                 pass
             sharetype['extra_specs'] = extra_specs
             try:
-                manager.create(**sharetype)
+                return manager.create(**sharetype)
             except:
                 sharetype.pop('description')
-                manager.create(**sharetype)
+                return manager.create(**sharetype)
 
         # validation sharetype
         share_type = validate_share_type(share_type)
         logging.debug("Validated Manila share type %s" % share_type)
 
         # update share type if exists
-        stype = get_type_by_name(share_type['name'])
+        stype = self.catalog.get(share_type['name'])
+        self.diffs[share_type['name']] = []
         if stype:
             try:
-                if not self.dry_run:
-                    update_type(stype, share_type['extra_specs'])
+                update_type(stype, share_type['extra_specs'])
             except Exception as e:
                 logging.error("Failed to update share type %s: %s" % (share_type, e))
                 raise
         else:
+            self.diffs[share_type['name']].append('create')
             try:
                 if not self.dry_run:
-                    create_type(share_type)
+                    self.catalog.add(create_type(share_type))
             except Exception as e:
                 logging.error("Failed to create share type %s: %s" % (share_type, e))
                 raise
\ No newline at end of file
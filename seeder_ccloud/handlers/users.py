@@ -28,7 +28,8 @@ def seed_domain_users_handler(memo: kopf.Memo, new, old, name, annotations, **_)
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, 'dependencies error'), delay=30)
     try:
         changed = utils.get_changed_seeds(old, new)
-        Users(memo['args']).seed(changed)
+        with OpenstackHelper(memo['args']).revalidating_restored_ids():
+            Users(memo['args'], memo['dry_run']).seed(changed)
     except Exception as error:
         raise kopf.TemporaryError('error seeding {}: {}'.format(name, error), delay=30)
 
@@ -41,8 +42,11 @@ class Users():
 
 
     def seed(self, users):
-        for user in users:
-            self._seed_user(user)
+        try:
+            for user in users:
+                self._seed_user(user)
+        finally:
+            self.openstack.password_fingerprints.save()
 
 
     def _seed_user(self, user):
@@ -52,8 +56,7 @@ class Users():
         keystone = self.openstack.get_keystoneclient()
 
         if '@' in user['name']:
-            user, domain_name = user['name'].split('@')
-            user['name'] = user
+            user['name'], domain_name = user['name'].split('@')
             # throws exception when domain does not exist
             domain_id = self.openstack.get_domain_id(domain_name)
         else:
@@ -64,6 +67,9 @@ class Users():
             'name', 'email', 'description', 'password', 'enabled',
             'default_project'))
 
+        fingerprints = self.openstack.password_fingerprints
+        password = user.get('password')
+
         result = keystone.users.list(domain=domain_id,
                                     name=user['name'])
         if not result:
@@ -71,13 +77,29 @@ class Users():
                 "create user '%s/%s'" % (domain_name, user['name']))
             if not self.dry_run:
                 resource = keystone.users.create(domain=domain_id, **user)
+                self.openstack.cache_id('user', domain_name, user['name'], resource_id=resource.id)
+                if password:
+                    fingerprints.put(domain_name, user['name'], password)
         else:
             resource = result[0]
-            # no need to diff, since we only work on the users that
-            # changed in kubernetes. Will leave it for logging reasons
+            self.openstack.cache_id('user', domain_name, user['name'], resource_id=resource.id)
             diff = DeepDiff(user, resource.to_dict(), exclude_obj_callback=utils.diff_exclude_password_callback)
             if 'values_changed' in diff:
                 logging.debug("user %s differs: '%s'" % (user['name'], diff))
 
+            # keystone rehashes every password it gets, only send changed attributes
+            current = resource.to_dict()
+            current['default_project'] = current.get('default_project_id')
+            update = {attr: value for attr, value in user.items()
+                      if attr != 'password' and value != current.get(attr)}
+            if password and not fingerprints.matches(domain_name, user['name'], password):
+                update['password'] = password
+            if not update:
+                logging.debug("user '%s/%s' is unchanged" % (domain_name, user['name']))
+                return
+
+            logging.info("update user '%s/%s': %s" % (domain_name, user['name'], sorted(update.keys())))
             if not self.dry_run:
-                keystone.users.update(resource.id, **user)
\ No newline at end of file
+                keystone.users.update(resource.id, **update)
+                if 'password' in update:
+                    fingerprints.put(domain_name, user['name'], password)
\ No newline at end of file
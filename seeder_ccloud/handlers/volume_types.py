@@ -17,6 +17,7 @@
 import logging, kopf
 from seeder_ccloud import utils
 from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.openstack.volume_type_catalog import VolumeTypeCatalog
 
 config = utils.Config()
 
@@ -52,6 +53,7 @@ class Volume_Types():
 
 
     def seed(self, volume_types):
+        self.catalog = None
         for volume_type in volume_types:
             self._seed_volume_type(volume_type)
 
@@ -66,35 +68,46 @@ class Volume_Types():
             logging.error("Fail to initialize cinder client: %s" % e)
             raise
 
-        def get_type_by_name(name):
-            for t in cinder.volume_types.list(is_public=volume_type['is_public']):
-                if t.name == name:
-                    return t
-            return None
+        # list the volume types once per seed run
+        if self.catalog is None:
+            self.catalog = VolumeTypeCatalog(cinder)
 
         def update_type(vtype, volume_type):
-            logging.debug("updating volume-type '%s'", volume_type['name'])
-            cinder.volume_types.update(vtype, volume_type['name'], volume_type['description'], volume_type['is_public'])
+            attrs = {}
+            for attr in ('description', 'is_public'):
+                if attr in volume_type and volume_type[attr] != getattr(vtype, attr, None):
+                    attrs[attr] = volume_type[attr]
+            if attrs:
+                logging.info("updating volume-type '%s': %s", volume_type['name'], attrs)
+                if not self.dry_run:
+                    vtype = self.catalog.update(vtype, **attrs)
+            update_extra_specs(vtype, volume_type.get('extra_specs', {}))
+
+        def update_extra_specs(vtype, extra_specs):
+            # cinder returns all extra spec values as strings
+            current = self.catalog.get_extra_specs(vtype)
+            changed = {k: v for k, v in extra_specs.items() if str(v) != current.get(k)}
+            if changed:
+                logging.info("updating extra specs of volume-type '%s': %s", vtype.name, changed)
+                if not self.dry_run:
+                    self.catalog.set_extra_specs(vtype, changed)
 
         def create_type(volume_type):
-            logging.debug("updating volume-type '%s'", volume_type['name'])
-            vtype = cinder.volume_types.create(volume_type['name'], volume_type['description'], volume_type['is_public'])
-            if 'extra_specs' in volume_type:
-                extra_specs = volume_type.pop('extra_specs', None)
-                vtype.set_keys(extra_specs)
+            logging.info("creating volume-type '%s'", volume_type['name'])
+            if not self.dry_run:
+                vtype = self.catalog.create(volume_type['name'], volume_type['description'], volume_type['is_public'])
+                update_extra_specs(vtype, volume_type.get('extra_specs', {}))
 
-        vtype = get_type_by_name(volume_type['name'])
+        vtype = self.catalog.get(volume_type['name'])
         if vtype:
             try:
-                if not self.dry_run:
-                    update_type(vtype, volume_type)
+                update_type(vtype, volume_type)
             except Exception as e:
                 logging.error("Failed to update volume type %s: %s" % (volume_type, e))
                 raise
         else:
             try:
-                if not self.dry_run:
-                    create_type(volume_type)
+                create_type(volume_type)
             except Exception as e:
                 logging.error("Failed to create volume type %s: %s" % (volume_type, e))
-                raise
\ No newline at end of file
+                raise
@@ -0,0 +1,35 @@
+"""
+ Copyright 2022 SAP SE
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+from seeder_ccloud.openstack.resource_catalog import ResourceCatalog
+
+
+class FlavorCatalog(ResourceCatalog):
+    """ the nova flavors by id, public and private, and the projects with access to the private ones """
+    kind = 'nova flavors'
+
+    def __init__(self, client):
+        super().__init__(client, client.flavors.list(is_public=None), lambda f: f.id)
+
+
+    def projects(self, flavor_id):
+        """ ids of the projects with access to a private flavor """
+        return self._detail(flavor_id, lambda: {
+            a.tenant_id for a in self.client.flavor_access.list(flavor=flavor_id)})
+
+
+    def add_project_access(self, flavor_id, project_id):
+        self.client.flavor_access.add_tenant_access(flavor_id, project_id)
+        self.projects(flavor_id).add(project_id)
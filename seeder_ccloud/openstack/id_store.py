@@ -0,0 +1,54 @@
+"""
+ Copyright 2022 SAP SE
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import json, logging, sqlite3, threading
+from datetime import datetime
+
+
+class IdStore():
+    """
+    sqlite backed copy of the OpenstackHelper id cache, so the resolved ids
+    survive operator restarts.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS ids (key TEXT PRIMARY KEY, id TEXT NOT NULL, stored_at TIMESTAMP NOT NULL)')
+
+
+    def load(self, max_age):
+        """ return all ids which have been stored within max_age """
+        oldest = datetime.now() - max_age
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM ids WHERE stored_at < ?', (oldest.isoformat(),))
+            rows = self.conn.execute('SELECT key, id FROM ids').fetchall()
+        logging.info('loaded {} ids from {}'.format(len(rows), self.path))
+        return {tuple(json.loads(key)): id for key, id in rows}
+
+
+    def put(self, ids):
+        """ store a dict of ids, keyed by their id cache key """
+        stored_at = datetime.now().isoformat()
+        with self.lock, self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO ids (key, id, stored_at) VALUES (?, ?, ?)',
+                                  [(json.dumps(key), id, stored_at) for key, id in ids.items()])
+
+
+    def delete(self, keys):
+        with self.lock, self.conn:
+            self.conn.executemany('DELETE FROM ids WHERE key = ?', [(json.dumps(key),) for key in keys])
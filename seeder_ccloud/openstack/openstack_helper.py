@@ -1,10 +1,9 @@
-import copy
+import copy, logging, json, hashlib
 from datetime import datetime, timedelta
-import threading, operator
+import threading, functools, contextlib
 
-from cachetools import TTLCache, cachedmethod
-from cachetools.keys import hashkey
-from functools import partial
+from concurrent.futures import Future
+from cachetools import TTLCache
 from keystoneclient.v3 import client as keystoneclient
 from neutronclient.v2_0 import client as neutronclient
 from designateclient.v2 import client as designateclient
@@ -15,67 +14,237 @@ from novaclient import client as novaclient
 from osc_placement.http import SessionClient as placementclient
 from keystoneauth1.loading import cli
 from keystoneauth1 import session
+from keystoneauth1 import exceptions as keystoneauthexceptions
+from seeder_ccloud.openstack.id_store import IdStore
+from seeder_ccloud.openstack.password_fingerprints import PasswordFingerprints
+
+class ResourceNotFound(Exception):
+    """ raised by the id resolvers if a named resource does not exist """
+
+
+class PartitionedTTLCache():
+    """
+    thread-safe TTLCache, partitioned by the first item of the key (the resource
+    kind or client name). Each partition has its own lock, so workers looking up
+    different kinds do not block each other. maxsize applies per partition.
+    """
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.partitions = {}
+        self.partitions_lock = threading.Lock()
+
+
+    def _partition(self, key):
+        try:
+            return self.partitions[key[0]]
+        except KeyError:
+            with self.partitions_lock:
+                return self.partitions.setdefault(
+                    key[0], (threading.RLock(), TTLCache(maxsize=self.maxsize, ttl=self.ttl, timer=datetime.now)))
+
+
+    def __getitem__(self, key):
+        lock, cache = self._partition(key)
+        with lock:
+            return cache[key]
+
+
+    def __setitem__(self, key, value):
+        lock, cache = self._partition(key)
+        with lock:
+            cache[key] = value
+
+
+    def __contains__(self, key):
+        lock, cache = self._partition(key)
+        with lock:
+            return key in cache
+
+
+    def __len__(self):
+        return sum(len(cache) for _, cache in list(self.partitions.values()))
+
+
+    def get(self, key, default=None):
+        lock, cache = self._partition(key)
+        with lock:
+            return cache.get(key, default)
+
+
+    def pop(self, key, default=None):
+        lock, cache = self._partition(key)
+        with lock:
+            return cache.pop(key, default)
+
+
+    def clear(self):
+        for lock, cache in list(self.partitions.values()):
+            with lock:
+                cache.clear()
+
+
+    def free(self, kind):
+        """ number of entries that still fit into the partition of kind """
+        lock, cache = self._partition((kind,))
+        with lock:
+            return self.maxsize - len(cache)
+
+
+    def get_or_load(self, key, load):
+        """ return the cached value of key, or load and cache it while holding the partition lock """
+        lock, cache = self._partition(key)
+        with lock:
+            try:
+                return cache[key]
+            except KeyError:
+                value = cache[key] = load()
+                return value
+
+
+def cached_client(name):
+    """ cache an openstack client in client_cache, constructing it only once """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (name,) + args + tuple(sorted(kwargs.items()))
+            return self.client_cache.get_or_load(key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def cached_id(kind):
+    """
+    cache the result of an id resolver in id_cache. A resolver raising
+    ResourceNotFound is remembered in not_found_cache, so a seed referencing a
+    missing resource does not query the api again on every retry.
+    Concurrent calls for the same key share a single api request.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            key = (kind,) + args
+            id = self._get_cached_id(key)
+            if id is not None:
+                return id
+            error = self.not_found_cache.get(key)
+            if error is not None:
+                raise ResourceNotFound(error)
+
+            with self.in_flight_lock:
+                future = self.in_flight.get(key)
+                if future is None:
+                    future = self.in_flight[key] = Future()
+                    leader = True
+                else:
+                    leader = False
+            if not leader:
+                return future.result()
+
+            try:
+                # a previous leader might have stored the id after the lookup above
+                id = self.id_cache.get(key)
+                if id is not None:
+                    future.set_result(id)
+                    return id
+                id = method(self, *args)
+            except Exception as e:
+                if isinstance(e, ResourceNotFound):
+                    self.not_found_cache[key] = str(e)
+                future.set_exception(e)
+                raise
+            else:
+                self._store_id(key, id)
+                future.set_result(id)
+                return id
+            finally:
+                with self.in_flight_lock:
+                    del self.in_flight[key]
+        return wrapper
+    return decorator
 
-lock = threading.RLock()
 
 class OpenstackHelper:
     _singleton = None
     args = None
     session = None
+    # below this many unresolved names per domain, the batch resolvers
+    # look them up one by one instead of listing the whole domain
+    batch_listing_threshold = 3
 
     def __new__(cls, args):
         if not cls._singleton:
             cls._singleton = super(OpenstackHelper, cls).__new__(cls)
             cls.args = args
-            cls.id_cache = TTLCache(maxsize=5000, ttl=timedelta(days=30), timer=datetime.now)
-            cls.client_cache = TTLCache(maxsize=10, ttl=timedelta(minutes=5), timer=datetime.now)
+            cls.id_cache = PartitionedTTLCache(maxsize=5000, ttl=timedelta(days=30))
+            cls.not_found_cache = PartitionedTTLCache(maxsize=1000, ttl=timedelta(minutes=2))
+            cls.client_cache = PartitionedTTLCache(maxsize=10, ttl=timedelta(minutes=5))
+            # (resource_type, id) -> (revision_number, seed fingerprint) of neutron
+            # resources the seeder verified or updated
+            cls.revision_cache = PartitionedTTLCache(maxsize=5000, ttl=timedelta(days=1))
+            # keystone service catalog, it rarely changes
+            cls.catalog_cache = PartitionedTTLCache(maxsize=50, ttl=timedelta(hours=6))
+            cls.in_flight = {}
+            cls.in_flight_lock = threading.Lock()
+            cls.id_store = None
+            cls.restored_ids = set()
+            # restored ids used by the operation running in a thread
+            cls.restored_ids_in_use = threading.local()
+            cls.password_fingerprints = PasswordFingerprints(getattr(args, 'password_fingerprint_secret', None),
+                                                             getattr(args, 'password_fingerprint_iterations', None))
+            id_cache_file = getattr(args, 'id_cache_file', None)
+            if id_cache_file:
+                cls.id_store = IdStore(id_cache_file)
+                for key, id in cls.id_store.load(cls.id_cache.ttl).items():
+                    cls.id_cache[key] = id
+                    cls.restored_ids.add(key)
 
         return cls._singleton
     
 
-    @cachedmethod(operator.attrgetter('client_cache'), partial(hashkey, 'keystone'))
+    @cached_client('keystone')
     def get_keystoneclient(self):
         session = self.get_session(self.args)
         return keystoneclient.Client(session=session,
                                      interface=self.args.interface)
 
 
-    @cachedmethod(operator.attrgetter('client_cache'), partial(hashkey, 'neutron'))
+    @cached_client('neutron')
     def get_neutronclient(self):
         session = self.get_session(self.args)
         return neutronclient.Client(session=session,
                                     interface=self.args.interface)
 
 
-    @cachedmethod(operator.attrgetter('client_cache'), partial(hashkey, 'nova'))
+    @cached_client('nova')
     def get_novaclient(self):
         session = self.get_session(self.args)
         return novaclient.Client('2.1', session=session,
                                  endpoint_type=self.args.interface + 'URL')
 
     
-    @cachedmethod(operator.attrgetter('client_cache'), partial(hashkey, 'cinder'))
+    @cached_client('cinder')
     def get_cinderclient(self, api_version='3.50'):
         session = self.get_session(self.args)
         return cinderclient.Client(session=session, 
                                    interface=self.args.interface, api_version=api_version)
 
                             
-    @cachedmethod(operator.attrgetter('client_cache'), partial(hashkey, 'manila'))
+    @cached_client('manila')
     def get_manilaclient(self, api_version='2.40'):
         session = self.get_session(self.args)
         api_version = api_versions.APIVersion(api_version)
         return manilaclient.Client(session=session, api_version=api_version)
 
     
-    @cachedmethod(operator.attrgetter('client_cache'), partial(hashkey, 'placement'))
+    @cached_client('placement')
     def get_placementclient(self, api_version='1.6'):
         session = self.get_session(self.args)
         ks_filter = {'service_type': 'placement', 'interface': self.args.interface}
         return placementclient(session=session, ks_filter=ks_filter, api_version=api_version)
 
 
-    @cachedmethod(operator.attrgetter('client_cache'), partial(hashkey, 'designate'))
+    @cached_client('designate')
     def get_designateclient(self, project_id):
         # the designate client needs a token scoped to a project.id
         # due to a crappy bugfix in https://review.openstack.org/#/c/187570/
@@ -93,28 +262,45 @@ class OpenstackHelper:
                                         all_projects=True)
 
 
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'role'))
+    @cached_client('swift')
+    def get_swift_auth(self, project_id):
+        """
+        the storage url of a projects swift account and the token to access it,
+        shared by all swift requests for the project while cached
+        """
+        sess = self.get_session(self.args)
+        # poor mans storage-url generation
+        try:
+            swift_endpoint = sess.get_endpoint(service_type='object-store',
+                                               interface=self.args.interface)
+        except keystoneauthexceptions.EndpointNotFound:
+            swift_endpoint = sess.get_endpoint(service_type='object-store',
+                                               interface='admin')
+        storage_url = swift_endpoint.split('/AUTH_')[0] + '/AUTH_' + project_id
+        return storage_url, sess.get_token()
+
+
+    @cached_id('role')
     def get_role_id(self, name):
         """ get a (cached) role-id for a role name """
         roles = self.get_keystoneclient().roles.list(name=name)
         if roles:
             return roles[0].id
         else:
-            # returning none would be saved in the cache as well
-            raise Exception("role {0} not found".format(name))
+            raise ResourceNotFound("role {0} not found".format(name))
 
 
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'domain'))
+    @cached_id('domain')
     def get_domain_id(self, name):
         """ get a (cached) domain-id for a domain name """
         domains = self.get_keystoneclient().domains.list(name=name)
         if domains:
             return domains[0].id
         else:
-            raise Exception("domain {0} not found".format(name))
+            raise ResourceNotFound("domain {0} not found".format(name))
 
 
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'project'))
+    @cached_id('project')
     def get_project_id(self, domain, name):
         """ get a (cached) project-id for a domain and project name """
         projects = self.get_keystoneclient().projects.list(
@@ -123,10 +309,10 @@ class OpenstackHelper:
         if projects:
             return projects[0].id
         else:
-            raise Exception("project {0}/{1} not found".format(domain, name))
+            raise ResourceNotFound("project {0}/{1} not found".format(domain, name))
 
 
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'user'))
+    @cached_id('user')
     def get_user_id(self, domain, name):
         """ get a (cached) user-id for a domain and user name """
         users = self.get_keystoneclient().users.list(
@@ -135,10 +321,10 @@ class OpenstackHelper:
         if users:
             return users[0].id
         else:
-            raise Exception("user {0}/{1} not found".format(domain, name))
+            raise ResourceNotFound("user {0}/{1} not found".format(domain, name))
 
 
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'group'))
+    @cached_id('group')
     def get_group_id(self, domain, name):
         """ get a (cached) group-id for a domain and group name """
         groups = self.get_keystoneclient().groups.list(
@@ -147,40 +333,368 @@ class OpenstackHelper:
         if groups:
            return groups[0].id
         else:
-           raise Exception("group {0}/{1} not found".format(domain, name))
+           raise ResourceNotFound("group {0}/{1} not found".format(domain, name))
+
+
+    def get_project_ids(self, keys):
+        """ get (cached) project-ids for a set of (domain, project name) keys """
+        return self._get_ids('project', keys, self.get_keystoneclient().projects, self.get_project_id)
+
+
+    def get_user_ids(self, keys):
+        """ get (cached) user-ids for a set of (domain, user name) keys """
+        return self._get_ids('user', keys, self.get_keystoneclient().users, self.get_user_id)
+
+
+    def get_group_ids(self, keys):
+        """ get (cached) group-ids for a set of (domain, group name) keys """
+        return self._get_ids('group', keys, self.get_keystoneclient().groups, self.get_group_id)
+
+
+    def _get_ids(self, kind, keys, manager, get_id):
+        """
+        resolve (domain, name) keys of a keystone resource kind. Cached ids are
+        served from the id cache, the rest is fetched with one listing per domain.
+        Keys which do not exist are missing in the returned dict.
+        """
+        ids = {}
+        missing = {}
+        for domain, name in set(keys):
+            key = (kind, domain, name)
+            id = self._get_cached_id(key)
+            if id is not None:
+                ids[(domain, name)] = id
+            elif key not in self.not_found_cache:
+                missing.setdefault(domain, set()).add(name)
+
+        for domain, names in missing.items():
+            if len(names) < self.batch_listing_threshold:
+                for name in names:
+                    try:
+                        ids[(domain, name)] = get_id(domain, name)
+                    except ResourceNotFound:
+                        pass
+                continue
+            try:
+                domain_id = self.get_domain_id(domain)
+            except ResourceNotFound:
+                continue
+            found = {}
+            for resource in manager.list(domain=domain_id):
+                if resource.name in names and resource.name not in found:
+                    found[resource.name] = resource.id
+            self._store_ids({(kind, domain, name): id for name, id in found.items()})
+            for name in names:
+                if name in found:
+                    ids[(domain, name)] = found[name]
+                else:
+                    self.not_found_cache[(kind, domain, name)] = "{0} {1}/{2} not found".format(kind, domain, name)
+        return ids
 
 
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'subnetpool'))
+    @cached_id('subnetpool')
     def get_subnetpool_id(self, project_id, name):
         """ get a (cached) subnetpool-id for a project-id and subnetpool name """
-        query = {'tenant_id': project_id, 'name': name}
-        result = self.get_neutronclient().list_subnetpools(retrieve_all=True, **query)
-        if result and result['subnetpools']:
-            return result['subnetpools'][0]['id']
+        result = self.find_neutron_resource('subnetpools', fields=['id'], tenant_id=project_id, name=name)
+        if result:
+            return result['id']
         else:
-            raise Exception("subnetpool {0}/{1} not found".format(project_id, name))
+            raise ResourceNotFound("subnetpool {0}/{1} not found".format(project_id, name))
 
 
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'network'))
+    @cached_id('network')
     def get_network_id(self, project_id, name):
         """ get a (cached) network-id for a project-id and network name """
-        query = {'tenant_id': project_id, 'name': name}
-        result = self.get_neutronclient().list_networks(retrieve_all=True, **query)
-        if result and result['networks']:
-            return result['networks'][0]['id']     
+        result = self.find_neutron_resource('networks', fields=['id'], tenant_id=project_id, name=name)
+        if result:
+            return result['id']
         else:
-            raise Exception("network {0}/{1} not found".format(project_id, name))
-
-
-    @cachedmethod(operator.attrgetter('id_cache'), partial(hashkey, 'subnet'))
+            raise ResourceNotFound("network {0}/{1} not found".format(project_id, name))
+
+
+    def get_network_ids(self, keys, chunk_size=100):
+        """
+        get (cached) network-ids for a set of (project-id, network name) keys.
+        The uncached ones are fetched with a listing per chunk_size keys, filtered
+        by their projects and names. Keys which do not exist are missing in the returned dict.
+        """
+        ids = {}
+        missing = set()
+        for project_id, name in set(keys):
+            key = ('network', project_id, name)
+            id = self._get_cached_id(key)
+            if id is not None:
+                ids[(project_id, name)] = id
+            elif key not in self.not_found_cache:
+                missing.add((project_id, name))
+
+        if len(missing) < self.batch_listing_threshold:
+            for project_id, name in missing:
+                try:
+                    ids[(project_id, name)] = self.get_network_id(project_id, name)
+                except ResourceNotFound:
+                    pass
+            return ids
+
+        found = {}
+        missing_keys = sorted(missing)
+        # keep the query strings short
+        for i in range(0, len(missing_keys), chunk_size):
+            chunk = missing_keys[i:i + chunk_size]
+            networks = self.iter_neutron_resources('networks', fields=['id', 'name', 'tenant_id'],
+                                                   tenant_id=sorted({p for p, _ in chunk}),
+                                                   name=sorted({n for _, n in chunk}))
+            for network in networks:
+                key = (network['tenant_id'], network['name'])
+                if key in missing and key not in found:
+                    found[key] = network['id']
+        self._store_ids({('network',) + key: id for key, id in found.items()})
+        for project_id, name in missing:
+            if (project_id, name) in found:
+                ids[(project_id, name)] = found[(project_id, name)]
+            else:
+                self.not_found_cache[('network', project_id, name)] = "network {0}/{1} not found".format(project_id, name)
+        return ids
+
+
+    @cached_id('subnet')
     def get_subnet_id(self, project_id, name):
         """ get a (cached) subnet-id for a project-id and subnet name """
-        query = {'tenant_id': project_id, 'name': name}
-        result = self.get_neutronclient().list_subnets(retrieve_all=True, **query)
-        if result and result['subnets']:
-            return result['subnets'][0]['id']
+        result = self.find_neutron_resource('subnets', fields=['id'], tenant_id=project_id, name=name)
+        if result:
+            return result['id']
         else:
-            raise Exception("subnet {0}/{1} not found".format(project_id, name))
+            raise ResourceNotFound("subnet {0}/{1} not found".format(project_id, name))
+
+
+    def iter_neutron_resources(self, collection, fields=None, page_size=500, **filters):
+        """
+        lazily page through a neutron collection, e.g. 'ports', and yield its
+        resources one by one. fields restricts the returned attributes.
+        """
+        if fields:
+            filters['fields'] = fields
+        list_resources = getattr(self.get_neutronclient(), 'list_' + collection)
+        for page in list_resources(retrieve_all=False, limit=page_size, **filters):
+            for resource in page[collection]:
+                yield resource
+
+
+    @staticmethod
+    def iter_designate_resources(list_resources, *args, page_size=1000):
+        """
+        page through a designate listing, e.g. designate.zones.list, following
+        the next links, and yield its resources one by one
+        """
+        marker = None
+        while True:
+            page = list_resources(*args, marker=marker, limit=page_size)
+            for resource in page:
+                yield resource
+            marker = page.next_link_criterion.get('marker') if getattr(page, 'next_page', False) else None
+            if not marker:
+                return
+
+
+    def find_neutron_resource(self, collection, fields=None, **filters):
+        """ return the first resource of a neutron collection matching filters, or None """
+        return next(self.iter_neutron_resources(collection, fields, page_size=1, **filters), None)
+
+
+    def cache_id(self, kind, *args, resource_id):
+        """ write the id of a resource the seeder created or found into the id cache """
+        key = (kind,) + args
+        self.not_found_cache.pop(key, None)
+        self._store_id(key, resource_id)
+
+
+    def get_service_catalog(self):
+        """
+        the services and endpoints of the keystone catalog, listed once and
+        cached in catalog_cache
+        :return: dict with the lists of 'services' and 'endpoints'
+        """
+        def load():
+            keystone = self.get_keystoneclient()
+            catalog = {'services': keystone.services.list(), 'endpoints': keystone.endpoints.list()}
+            logging.debug('listed {} services and {} endpoints'.format(
+                len(catalog['services']), len(catalog['endpoints'])))
+            return catalog
+        return self.catalog_cache.get_or_load(('catalog',), load)
+
+
+    def invalidate_service_catalog(self):
+        """ drop the cached service catalog, after services or endpoints were changed """
+        self.catalog_cache.pop(('catalog',), None)
+
+
+    def has_service(self, name):
+        """ True if the keystone catalog has a service of this name """
+        return any(s.name == name for s in self.get_service_catalog()['services'])
+
+
+    def is_revision_verified(self, resource_type, resource, seed):
+        """ True if the neutron resource is still at the revision the seed was verified against """
+        revision = resource.get('revision_number')
+        if revision is None:
+            return False
+        return self.revision_cache.get((resource_type, resource['id'])) == (revision, self.fingerprint(seed))
+
+
+    def verify_revision(self, resource_type, resource, seed):
+        """ remember that the neutron resource is in the state of seed at its current revision """
+        revision = resource.get('revision_number')
+        if revision is not None:
+            self.revision_cache[(resource_type, resource['id'])] = (revision, self.fingerprint(seed))
+
+
+    def update_neutron_resource(self, resource_type, resource, body):
+        """
+        update a neutron resource, only if it is still at the revision the
+        seeder compared against (If-Match). Neutron answers 412 otherwise and
+        the seed is retried with a fresh copy of the resource.
+        :return: the updated resource
+        """
+        neutron = self.get_neutronclient()
+        path = getattr(neutron, '{}_path'.format(resource_type)) % resource['id']
+        headers = None
+        if resource.get('revision_number') is not None:
+            headers = {'If-Match': 'revision_number={}'.format(resource['revision_number'])}
+        self.revision_cache.pop((resource_type, resource['id']), None)
+        return neutron.put(path, body=body, headers=headers)[resource_type]
+
+
+    def seed_neutron_tags(self, resource_type, resource, tags, dry_run=False):
+        """
+        add the missing tags to a neutron resource. Seeding only adds tags, so
+        the existing ones are kept: all of them are set with one replace-tags request.
+        :return: the added tags
+        """
+        current = set(resource.get('tags', []))
+        missing = sorted(set(tags) - current)
+        if missing:
+            logging.debug('adding tags {} to {} {}'.format(missing, resource_type, resource['name']))
+            if not dry_run:
+                neutron = self.get_neutronclient()
+                path = getattr(neutron, '{}_path'.format(resource_type)) % resource['id']
+                neutron.put(path + '/tags', body={'tags': sorted(current.union(missing))})
+        return missing
+
+
+    @contextlib.contextmanager
+    def revalidating_restored_ids(self):
+        """
+        track the ids restored from the id store which an operation uses. If it
+        fails with a not found or conflict error, one of them may be stale: they
+        are dropped, and the next reconcile resolves them again.
+        """
+        used = self.restored_ids_in_use.keys = set()
+        try:
+            yield
+        except Exception as e:
+            if self.is_stale_id_error(e):
+                self.revalidate_restored_ids(used)
+            raise
+        finally:
+            self.restored_ids_in_use.keys = None
+
+
+    def revalidate_restored_ids(self, keys):
+        """ drop those of keys which are restored ids not confirmed since the restart """
+        keys = [key for key in keys if key in self.restored_ids]
+        if not keys:
+            return
+        logging.info('dropping {} restored ids used by a failed operation'.format(len(keys)))
+        for key in keys:
+            self.restored_ids.discard(key)
+            self.id_cache.pop(key, None)
+        self.id_store.delete(keys)
+
+
+    @staticmethod
+    def is_stale_id_error(error):
+        """ True if error is, or was raised while handling, a not found or conflict answer of an openstack api """
+        while error is not None:
+            for attr in ('http_status', 'status_code', 'code'):
+                if getattr(error, attr, None) in (404, 409):
+                    return True
+            error = error.__cause__ or error.__context__
+        return False
+
+
+    def warm_up_id_cache(self):
+        """
+        fill the id cache from bulk listings of keystone and neutron resources,
+        instead of resolving the names one by one. Meant to run in the background,
+        seeding can go on with a partially warm cache.
+        """
+        logging.info('warming up id cache')
+        keystone = self.get_keystoneclient()
+        full = set()
+
+        def listings():
+            domains = keystone.domains.list()
+            yield 'domains', 'domain', ((('domain', d.name), d.id) for d in domains)
+            yield 'roles', 'role', ((('role', r.name), r.id) for r in keystone.roles.list())
+            for domain in domains:
+                for kind, manager in (('project', keystone.projects), ('group', keystone.groups),
+                                      ('user', keystone.users)):
+                    if kind not in full:
+                        resources = manager.list(domain=domain.id)
+                        yield '{}s of domain {}'.format(kind, domain.name), kind, \
+                            (((kind, domain.name, r.name), r.id) for r in resources)
+            for kind, collection in (('subnetpool', 'subnetpools'), ('network', 'networks'),
+                                     ('subnet', 'subnets')):
+                resources = self.iter_neutron_resources(collection, fields=['id', 'name', 'tenant_id'])
+                yield collection, kind, (((kind, r['tenant_id'], r['name']), r['id']) for r in resources)
+
+        try:
+            for what, kind, ids in listings():
+                # ids resolved since the start are fresher than the listing,
+                # and the resolvers return the first match of duplicate names
+                new_ids = {}
+                for key, id in ids:
+                    if key not in new_ids and (key not in self.id_cache or key in self.restored_ids):
+                        new_ids[key] = id
+                free = self.id_cache.free(kind)
+                self._store_ids(dict(list(new_ids.items())[:free]))
+                logging.info('id cache warm-up: {} {}'.format(min(len(new_ids), free), what))
+                if len(new_ids) >= free:
+                    logging.info('id cache is full for {}s'.format(kind))
+                    full.add(kind)
+        except Exception as e:
+            logging.error('id cache warm-up failed: {}'.format(e))
+            return
+        logging.info('id cache warm-up done: {} ids cached'.format(len(self.id_cache)))
+
+
+    def _get_cached_id(self, key):
+        id = self.id_cache.get(key)
+        if id is not None and key in self.restored_ids:
+            used = getattr(self.restored_ids_in_use, 'keys', None)
+            if used is not None:
+                used.add(key)
+        return id
+
+
+    def _store_id(self, key, id):
+        self._store_ids({key: id})
+
+
+    def _store_ids(self, ids):
+        # ids found again on every reconcile are already stored, skip the disk write
+        ids = {key: id for key, id in ids.items()
+               if key in self.restored_ids or self.id_cache.get(key) != id}
+        for key, id in ids.items():
+            self.id_cache[key] = id
+            self.restored_ids.discard(key)
+        if self.id_store and ids:
+            self.id_store.put(ids)
+
+
+    @staticmethod
+    def fingerprint(seed):
+        return hashlib.sha256(json.dumps(seed, sort_keys=True, default=str).encode()).hexdigest()
 
 
     @staticmethod
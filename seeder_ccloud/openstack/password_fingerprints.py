@@ -0,0 +1,135 @@
+"""
+ Copyright 2022 SAP SE
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import base64, hashlib, hmac, json, logging, os, threading
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+
+class PasswordFingerprints():
+    """
+    salted fingerprints of the user passwords the seeder last applied, so
+    unchanged passwords are not sent to keystone again, which rehashes every
+    password it receives. Kept in memory and, if a secret ('namespace/name')
+    is given, persisted in that kubernetes secret.
+    Each fingerprint records its pbkdf2 iteration count, so changing the
+    iterations does not invalidate the existing ones. Secrets are limited to
+    1 MiB: beyond max_bytes the fingerprints applied longest ago are dropped,
+    their passwords are sent to keystone once more.
+    """
+    data_key = 'fingerprints'
+    default_iterations = 20000
+    # the encoded fingerprints, leaving room for the metadata of the secret
+    max_bytes = 900 * 1024
+
+    def __init__(self, secret=None, iterations=None):
+        self.secret = secret
+        self.iterations = iterations or self.default_iterations
+        self.lock = threading.Lock()
+        self.fingerprints = None
+        self.dirty = False
+
+
+    def matches(self, domain_name, user_name, password):
+        """ True if password is the one last applied to the user """
+        with self.lock:
+            fingerprint = self._fingerprints().get(self._key(domain_name, user_name))
+        if not fingerprint:
+            return False
+        iterations, salt, digest = fingerprint.split('$')
+        return hmac.compare_digest(self._digest(password, base64.b64decode(salt), int(iterations)), digest)
+
+
+    def put(self, domain_name, user_name, password):
+        salt = os.urandom(16)
+        fingerprint = '{}${}${}'.format(
+            self.iterations, base64.b64encode(salt).decode(), self._digest(password, salt, self.iterations))
+        key = self._key(domain_name, user_name)
+        with self.lock:
+            fingerprints = self._fingerprints()
+            # keep the fingerprints ordered by the time they were applied
+            fingerprints.pop(key, None)
+            fingerprints[key] = fingerprint
+            self.dirty = True
+
+
+    def save(self):
+        """ write the fingerprints to the secret, if they changed """
+        with self.lock:
+            if not self.secret or not self.dirty:
+                return
+            namespace, name = self.secret.split('/')
+            data = {self.data_key: self._encode()}
+            api = client.CoreV1Api()
+            try:
+                api.patch_namespaced_secret(name, namespace, {'data': data})
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                api.create_namespaced_secret(namespace, client.V1Secret(
+                    metadata=client.V1ObjectMeta(name=name), data=data))
+            self.dirty = False
+
+
+    def _encode(self):
+        """ the base64 encoded fingerprints, the oldest ones dropped to fit into max_bytes """
+        dropped = 0
+        while True:
+            data = base64.b64encode(json.dumps(self.fingerprints).encode()).decode()
+            if len(data) <= self.max_bytes or not self.fingerprints:
+                break
+            # each fingerprint takes about the same space, drop the excess at once
+            excess = (len(data) - self.max_bytes) * len(self.fingerprints) // len(data) + 1
+            for key in list(self.fingerprints)[:excess]:
+                del self.fingerprints[key]
+            dropped += excess
+        if dropped:
+            logging.warning('dropped the {} oldest password fingerprints, the secret {} is full'.format(
+                dropped, self.secret))
+        return data
+
+
+    def _fingerprints(self):
+        if self.fingerprints is None:
+            self.fingerprints = self._load()
+        return self.fingerprints
+
+
+    def _load(self):
+        if not self.secret:
+            return {}
+        namespace, name = self.secret.split('/')
+        try:
+            secret = client.CoreV1Api().read_namespaced_secret(name, namespace)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            return {}
+        data = (secret.data or {}).get(self.data_key)
+        if not data:
+            return {}
+        fingerprints = json.loads(base64.b64decode(data))
+        logging.info('loaded {} password fingerprints from secret {}'.format(len(fingerprints), self.secret))
+        return fingerprints
+
+
+    @staticmethod
+    def _key(domain_name, user_name):
+        return json.dumps([domain_name, user_name])
+
+
+    @staticmethod
+    def _digest(password, salt, iterations):
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, iterations).hex()
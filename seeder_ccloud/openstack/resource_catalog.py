@@ -0,0 +1,42 @@
+"""
+ Copyright 2022 SAP SE
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import logging
+
+
+class ResourceCatalog():
+    """
+    the openstack resources of one kind, listed once and indexed by key, and
+    details of single resources (access lists, extra specs) loaded once on first
+    use. Changes made through a catalog are written through, so it stays valid
+    for the whole seed run.
+    """
+    kind = 'resources'
+
+    def __init__(self, client, resources, key):
+        self.client = client
+        self.resources = {key(r): r for r in resources}
+        self.details = {}
+        logging.debug('listed {} {}'.format(len(self.resources), self.kind))
+
+
+    def get(self, key):
+        return self.resources.get(key)
+
+
+    def _detail(self, resource_id, load):
+        if resource_id not in self.details:
+            self.details[resource_id] = load()
+        return self.details[resource_id]
@@ -0,0 +1,68 @@
+"""
+ Copyright 2022 SAP SE
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+from seeder_ccloud.openstack.resource_catalog import ResourceCatalog
+
+
+class ShareTypeCatalog(ResourceCatalog):
+    """ the manila share types by name, and the projects with access to the private ones """
+    kind = 'manila share types'
+
+    def __init__(self, client):
+        super().__init__(client, client.share_types.list(search_opts={'all_tenants': 1}), lambda t: t.name)
+
+
+    def add(self, share_type):
+        self.resources[share_type.name] = share_type
+
+
+    def get_extra_specs(self, share_type):
+        """ the extra specs of a share type, as included in the listing """
+        return dict(share_type.get_keys())
+
+
+    def set_extra_specs(self, share_type, extra_specs):
+        share_type.set_keys(extra_specs)
+        share_type.extra_specs = dict(self.get_extra_specs(share_type), **extra_specs)
+
+
+    def unset_extra_specs(self, share_type, keys):
+        share_type.unset_keys(keys)
+        share_type.extra_specs = {k: v for k, v in self.get_extra_specs(share_type).items() if k not in keys}
+
+
+    def private_types(self):
+        return [t for t in self.resources.values() if t.is_public is False]
+
+
+    def projects(self, share_type):
+        """ ids of the projects with access to a private share type """
+        return self._detail(share_type.id, lambda: {
+            a.project_id for a in self.client.share_type_access.list(share_type)})
+
+
+    def types_of_project(self, project_id):
+        """ the private share types a project has access to """
+        return [t for t in self.private_types() if project_id in self.projects(t)]
+
+
+    def add_project_access(self, share_type, project_id):
+        self.client.share_type_access.add_project_access(share_type, project_id)
+        self.projects(share_type).add(project_id)
+
+
+    def remove_project_access(self, share_type, project_id):
+        self.client.share_type_access.remove_project_access(share_type, project_id)
+        self.projects(share_type).discard(project_id)
@@ -0,0 +1,59 @@
+"""
+ Copyright 2022 SAP SE
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+from seeder_ccloud.openstack.resource_catalog import ResourceCatalog
+
+
+class VolumeTypeCatalog(ResourceCatalog):
+    """ the cinder volume types by name, public and private, and their extra specs """
+    kind = 'cinder volume types'
+
+    def __init__(self, client):
+        super().__init__(client, client.volume_types.list(is_public=None), lambda t: t.name)
+
+
+    def get_extra_specs(self, volume_type):
+        """ the extra specs of a volume type, as included in the listing """
+        def load():
+            extra_specs = getattr(volume_type, 'extra_specs', None)
+            if extra_specs is None:
+                extra_specs = volume_type.get_keys()
+            return dict(extra_specs)
+        return self._detail(volume_type.id, load)
+
+
+    def create(self, name, description, is_public):
+        volume_type = self.client.volume_types.create(name, description, is_public)
+        self.resources[name] = volume_type
+        self.details[volume_type.id] = {}
+        return volume_type
+
+
+    def update(self, volume_type, **attrs):
+        """
+        update a volume type, and replace it in the catalog with the returned one
+        (is_public is a read-only property of the listed type)
+        :return: the updated volume type
+        """
+        # keep the listed extra specs, the update response does not carry them
+        self.get_extra_specs(volume_type)
+        updated = self.client.volume_types.update(volume_type, **attrs)
+        self.resources[updated.name] = updated
+        return updated
+
+
+    def set_extra_specs(self, volume_type, extra_specs):
+        volume_type.set_keys(extra_specs)
+        self.get_extra_specs(volume_type).update(extra_specs)
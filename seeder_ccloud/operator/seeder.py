@@ -20,6 +20,7 @@ import logging
 from kubernetes import config as k8s_config
 from seeder_ccloud import utils
 from seeder_ccloud.operator.handlers import Handlers
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
 
 
 config = utils.Config()
@@ -49,6 +50,11 @@ def startup(settings: kopf.OperatorSettings, **kwargs):
     settings.persistence.diffbase_storage = operator_storage
     settings.persistence.progress_storage = kopf.AnnotationsProgressStorage(prefix=config.prefix)
 
+    if args.warm_up_id_cache:
+        # do not block the startup, seeds can already use the partially filled cache
+        threading.Thread(target=OpenstackHelper(args).warm_up_id_cache,
+                         name='id-cache-warm-up', daemon=True).start()
+
 
 def setup_logging(logLevel):
     logging.basicConfig(
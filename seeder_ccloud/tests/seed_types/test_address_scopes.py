@@ -0,0 +1,36 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.projects.address_scopes import Address_Scopes
+from unittest.mock import patch
+
+
+class TestAddressScopes(unittest.TestCase):
+    def setUp(self):
+        OpenstackHelper({}).revision_cache.clear()
+
+
+    @patch.object(OpenstackHelper, 'get_project_id', return_value='p1')
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_address_scope_revision(self, neutron_mock, project_mock):
+        neutron = neutron_mock.return_value
+        neutron.address_scope_path = '/address-scopes/%s'
+        neutron.list_address_scopes.return_value = {'address_scopes': [
+            {'id': 'a1', 'name': 'scope', 'ip_version': 4, 'shared': False, 'revision_number': 2}]}
+        a = Address_Scopes({}, False)
+        a.seed([{'name': 'scope', 'domain': 'Default', 'project': 'admin', 'ip_version': 4, 'shared': False}])
+        neutron.put.assert_not_called()
+
+        # unchanged revision, nothing is compared or sent
+        with patch('seeder_ccloud.handlers.projects.address_scopes.DeepDiff') as diff_mock:
+            diffs = a.seed([{'name': 'scope', 'domain': 'Default', 'project': 'admin', 'ip_version': 4,
+                             'shared': False}])
+        diff_mock.assert_not_called()
+        self.assertEqual(diffs, {'scope': []})
+        neutron.put.assert_not_called()
+
+        neutron.put.return_value = {'address_scope': {'id': 'a1', 'name': 'scope', 'ip_version': 4,
+                                                      'shared': True, 'revision_number': 3}}
+        a.seed([{'name': 'scope', 'domain': 'Default', 'project': 'admin', 'ip_version': 4, 'shared': True}])
+        neutron.put.assert_called_once_with('/address-scopes/a1',
+                                            body={'address_scope': {'name': 'scope', 'shared': True}},
+                                            headers={'If-Match': 'revision_number=2'})
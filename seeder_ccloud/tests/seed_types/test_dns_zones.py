@@ -0,0 +1,132 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.projects.dns_zones import DNS_Zones, render_zone_file, parse_zone_file
+from unittest.mock import patch, Mock
+from designateclient.v2.base import DesignateList
+
+
+os = OpenstackHelper({})
+def page(items, marker=None):
+    result = DesignateList(items)
+    if marker:
+        result.next_page = True
+        result.next_link_criterion = {'marker': marker}
+    return result
+
+
+class TestDNSZones(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_recordsets(self, openstack_mock):
+        designate = Mock()
+        designate.zones.list.return_value = page([{'id': 'z1', 'name': 'example.com.', 'ttl': 300, 'project_id': 'p1'}])
+        designate.recordsets.list.side_effect = [
+            page([{'id': 'r1', 'name': 'a.example.com.', 'type': 'A', 'records': ['10.0.0.1', '10.0.0.2'], 'ttl': 300}],
+                 marker='r1'),
+            page([{'id': 'r2', 'name': 'b.example.com.', 'type': 'A', 'records': ['10.0.0.3'], 'ttl': 300}]),
+        ]
+        openstack_mock.get_designateclient.return_value = designate
+        openstack_mock.get_project_id.return_value = 'p1'
+        openstack_mock.sanitize = os.sanitize
+        openstack_mock.iter_designate_resources = os.iter_designate_resources
+        d = DNS_Zones({}, False)
+        d.openstack = openstack_mock
+        d.seed([{'name': 'example.com.', 'domain': 'Default', 'project': 'admin', 'ttl': 300, 'recordsets': [
+            {'name': 'a.example.com.', 'type': 'A', 'records': ['10.0.0.2', '10.0.0.1'], 'ttl': 300},
+            {'name': 'b.example.com.', 'type': 'A', 'records': ['10.0.0.4'], 'ttl': 300},
+            {'name': 'c.example.com.', 'type': 'A', 'records': ['10.0.0.5']},
+        ]}])
+        designate.zones.update.assert_not_called()
+        designate.recordsets.update.assert_called_once_with('z1', 'r2', {'records': ['10.0.0.4']})
+        designate.recordsets.create.assert_called_once_with('z1', 'c.example.com.', 'A', ['10.0.0.5'],
+                                                            description=None, ttl=None)
+        designate.recordsets.list.assert_called_with('z1', marker='r1', limit=1000)
+        self.assertEqual(designate.recordsets.list.call_count, 2)
+
+
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_zone_file(self, openstack_mock):
+        recordsets = [
+            {'name': 'a.example.com.', 'type': 'A', 'records': ['10.0.0.1', '10.0.0.2'], 'ttl': 300},
+            {'name': 'b.example.com.', 'type': 'TXT', 'records': ['"hello world"']},
+        ]
+        zone_file = render_zone_file({'name': 'example.com.', 'email': 'dns@example.com', 'ttl': 600}, recordsets)
+        self.assertIn('example.com. IN SOA example.com. dns.example.com. 1 3600 600 86400 600', zone_file)
+        self.assertEqual(parse_zone_file(zone_file)[('b.example.com.', 'TXT')], (None, {'"hello world"'}))
+
+        designate = Mock()
+        designate.zones.list.return_value = page([{'id': 'z1', 'name': 'example.com.', 'ttl': 600, 'project_id': 'p1'}])
+        designate.zone_exports.create.return_value = {'id': 'e1', 'status': 'COMPLETE'}
+        designate.zone_exports.get_export.return_value = zone_file
+        designate.recordsets.list.return_value = [
+            {'id': 'r1', 'name': 'a.example.com.', 'type': 'A', 'records': ['10.0.0.1', '10.0.0.2'], 'ttl': 300}]
+        openstack_mock.get_designateclient.return_value = designate
+        openstack_mock.get_project_id.return_value = 'p1'
+        openstack_mock.sanitize = os.sanitize
+        openstack_mock.iter_designate_resources = os.iter_designate_resources
+        d = DNS_Zones({}, False)
+        d.openstack = openstack_mock
+        d.seed([{'name': 'example.com.', 'domain': 'Default', 'project': 'admin', 'ttl': 600, 'zone_file': True,
+                 'recordsets': [dict(r) for r in recordsets]}])
+        designate.recordsets.list.assert_not_called()
+        designate.zone_exports.delete.assert_called_once_with('e1')
+
+        recordsets[0]['records'] = ['10.0.0.1']
+        d.seed([{'name': 'example.com.', 'domain': 'Default', 'project': 'admin', 'ttl': 600, 'zone_file': True,
+                 'recordsets': [dict(r) for r in recordsets]}])
+        designate.recordsets.update.assert_called_once_with('z1', 'r1', {'records': ['10.0.0.1']})
+        designate.recordsets.list.assert_called_once_with(
+            'z1', criterion={'name': 'a.example.com.', 'type': 'A'})
+
+
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_zone_index(self, openstack_mock):
+        designate = Mock()
+        designate.zones.list.return_value = page([
+            {'id': 'z1', 'name': 'a.example.com.', 'ttl': 300, 'project_id': 'p1'},
+            {'id': 'z2', 'name': 'b.example.com.', 'ttl': 300, 'project_id': 'p2'},
+        ])
+        openstack_mock.get_designateclient.return_value = designate
+        openstack_mock.get_project_id.side_effect = lambda domain, project: project
+        openstack_mock.sanitize = os.sanitize
+        openstack_mock.iter_designate_resources = os.iter_designate_resources
+        d = DNS_Zones({}, False)
+        d.openstack = openstack_mock
+        d.seed([{'name': 'a.example.com.', 'domain': 'Default', 'project': 'p1', 'ttl': 300},
+                {'name': 'b.example.com.', 'domain': 'Default', 'project': 'p2', 'ttl': 300}])
+        designate.zones.list.assert_called_once()
+        designate.zones.update.assert_not_called()
+        designate.zones.create.assert_not_called()
+
+        self.assertRaisesRegex(Exception, 'already exists in project p2', d.seed,
+                               [{'name': 'b.example.com.', 'domain': 'Default', 'project': 'p1', 'ttl': 300}])
+
+
+    @patch('seeder_ccloud.handlers.projects.dns_zones.time.sleep')
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_zone_import(self, openstack_mock, sleep_mock):
+        designate = Mock()
+        designate.zones.list.return_value = page([])
+        designate.zone_imports.create.return_value = {'id': 'i1', 'status': 'PENDING'}
+        designate.zone_imports.get_import_record.side_effect = [
+            {'id': 'i1', 'status': 'PENDING'}, {'id': 'i1', 'status': 'COMPLETE', 'zone_id': 'z1'}]
+        designate.zones.update.return_value = {'id': 'z1', 'name': 'example.com.', 'project_id': 'p1'}
+        openstack_mock.get_designateclient.return_value = designate
+        openstack_mock.get_project_id.return_value = 'p1'
+        openstack_mock.sanitize = os.sanitize
+        openstack_mock.iter_designate_resources = os.iter_designate_resources
+        d = DNS_Zones({}, False)
+        d.openstack = openstack_mock
+        d.seed([{'name': 'example.com.', 'domain': 'Default', 'project': 'admin', 'email': 'dns@example.com',
+                 'description': 'example', 'zone_file': True,
+                 'recordsets': [{'name': 'a.example.com.', 'type': 'A', 'records': ['10.0.0.1']}]}])
+        self.assertEqual(designate.zone_imports.get_import_record.call_count, 2)
+        designate.zones.update.assert_called_once_with('z1', {'description': 'example'})
+        designate.zones.create.assert_not_called()
+
+        designate.zone_imports.create.return_value = {'id': 'i2', 'status': 'ERROR', 'message': 'invalid'}
+        self.assertRaisesRegex(Exception, 'failed: invalid', d.seed, [
+            {'name': 'other.com.', 'domain': 'Default', 'project': 'admin', 'email': 'dns@other.com',
+             'zone_file': True}])
+        self.assertRaisesRegex(Exception, 'only supported for PRIMARY', d.seed, [
+            {'name': 'secondary.com.', 'domain': 'Default', 'project': 'admin', 'type': 'SECONDARY',
+             'masters': ['10.0.0.1'], 'zone_file': True}])
@@ -0,0 +1,54 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.projects.networks import Networks
+from unittest.mock import patch
+
+
+class TestNetworks(unittest.TestCase):
+    def setUp(self):
+        OpenstackHelper({}).revision_cache.clear()
+
+
+    @patch.object(OpenstackHelper, 'get_project_id', return_value='p1')
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_network_tags(self, neutron_mock, project_mock):
+        neutron = neutron_mock.return_value
+        neutron.network_path = '/networks/%s'
+        neutron.list_networks.return_value = {'networks': [
+            {'id': 'n1', 'name': 'net', 'admin_state_up': True, 'revision_number': 3, 'tags': ['a']}]}
+        n = Networks({}, False)
+        diffs = n.seed([{'name': 'net', 'domain': 'Default', 'project': 'admin', 'admin_state_up': True,
+                         'tags': ['a', 'b']}])
+        self.assertEqual(diffs, {'net': ['create tag: b']})
+        # only the missing tag is added, together with the existing ones
+        neutron.put.assert_called_once_with('/networks/n1/tags', body={'tags': ['a', 'b']})
+
+        neutron.list_networks.return_value['networks'][0]['tags'] = ['a', 'b']
+        n.seed([{'name': 'net', 'domain': 'Default', 'project': 'admin', 'admin_state_up': True, 'tags': ['b']}])
+        neutron.put.assert_called_once()
+
+
+    @patch.object(OpenstackHelper, 'get_project_id', return_value='p1')
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_network_revision(self, neutron_mock, project_mock):
+        neutron = neutron_mock.return_value
+        neutron.network_path = '/networks/%s'
+        neutron.list_networks.return_value = {'networks': [
+            {'id': 'n1', 'name': 'net', 'admin_state_up': True, 'revision_number': 3}]}
+        n = Networks({}, False)
+        n.seed([{'name': 'net', 'domain': 'Default', 'project': 'admin', 'admin_state_up': True}])
+        self.assertTrue(OpenstackHelper({}).is_revision_verified(
+            'network', neutron.list_networks.return_value['networks'][0], {'name': 'net', 'admin_state_up': True}))
+
+        # unchanged revision, nothing is sent
+        with patch('seeder_ccloud.handlers.projects.networks.DeepDiff') as diff_mock:
+            diffs = n.seed([{'name': 'net', 'domain': 'Default', 'project': 'admin', 'admin_state_up': True}])
+        diff_mock.assert_not_called()
+        self.assertEqual(diffs, {'net': []})
+        neutron.put.assert_not_called()
+
+        neutron.put.return_value = {'network': {'id': 'n1', 'name': 'net', 'admin_state_up': False,
+                                                'revision_number': 4}}
+        n.seed([{'name': 'net', 'domain': 'Default', 'project': 'admin', 'admin_state_up': False}])
+        neutron.put.assert_called_once_with('/networks/n1', body={'network': {'name': 'net', 'admin_state_up': False}},
+                                            headers={'If-Match': 'revision_number=3'})
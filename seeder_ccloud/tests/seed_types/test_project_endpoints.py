@@ -0,0 +1,33 @@
+import unittest
+from seeder_ccloud.handlers.projects.endpoints import Endpoints
+from unittest.mock import patch
+from keystoneclient.v3.services import Service
+from keystoneclient.v3.endpoints import Endpoint
+
+
+class TestProjectEndpoints(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_project_endpoints(self, openstack_mock):
+        e1 = Endpoint(None, {'id': 'e1', 'service_id': 's1', 'interface': 'public', 'region_id': 'eu'})
+        e2 = Endpoint(None, {'id': 'e2', 'service_id': 's1', 'interface': 'internal', 'region_id': 'eu'})
+        e3 = Endpoint(None, {'id': 'e3', 'service_id': 's1', 'interface': 'public', 'region_id': 'us'})
+        openstack_mock.get_service_catalog.return_value = {
+            'services': [Service(None, {'id': 's1', 'name': 'arc', 'type': 'arc'})], 'endpoints': [e1, e2, e3]}
+        openstack_mock.get_project_id.return_value = 'p1'
+        keystone = openstack_mock.get_keystoneclient.return_value
+        keystone.endpoint_filter.list_endpoints_for_project.return_value = [e1]
+        e = Endpoints({}, False)
+        e.openstack = openstack_mock
+        e.seed([{'domain': 'Default', 'project': 'admin', 'service': 'arc', 'region': 'eu'},
+                {'domain': 'Default', 'project': 'admin', 'endpoint_id': 'e2'}])
+        keystone.endpoint_filter.list_endpoints_for_project.assert_called_once_with('p1')
+        keystone.endpoint_filter.add_endpoint_to_project.assert_called_once_with('p1', e2)
+        keystone.endpoint_filter.check_endpoint_in_project.assert_not_called()
+        self.assertRaisesRegex(Exception, 'service .* not found', e.seed,
+                               [{'domain': 'Default', 'project': 'admin', 'service': 'missing', 'region': 'eu'}])
+        # the catalog is listed fresh once per seed run
+        self.assertEqual(openstack_mock.invalidate_service_catalog.call_count, 2)
+
+        # a region without endpoints of the service is skipped
+        e.seed([{'domain': 'Default', 'project': 'admin', 'service': 'arc', 'region': 'ap'}])
+        keystone.endpoint_filter.add_endpoint_to_project.assert_called_once_with('p1', e2)
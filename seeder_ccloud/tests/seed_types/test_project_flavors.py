@@ -0,0 +1,29 @@
+import unittest
+from seeder_ccloud.handlers.projects.projects import Projects
+from unittest.mock import patch, Mock
+from keystoneclient.v3.projects import Project
+
+
+class TestProjectFlavors(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_project_flavors(self, openstack_mock):
+        nova = openstack_mock.get_novaclient.return_value
+        nova.flavors.list.return_value = [Mock(id='private1', is_public=False), Mock(id='private2', is_public=False),
+                                          Mock(id='public', is_public=True)]
+        nova.flavor_access.list.side_effect = lambda flavor: [Mock(tenant_id='p1')] if flavor == 'private1' else []
+        p = Projects({}, False)
+        p.openstack = openstack_mock
+        p1 = Project(None, {'id': 'p1', 'name': 'one'})
+        p2 = Project(None, {'id': 'p2', 'name': 'two'})
+        p.seed_project_flavors([(p1, ['private1', 'private2', 'public']), (p2, ['private1', 'private2'])])
+        nova.flavors.list.assert_called_once_with(is_public=None)
+        self.assertEqual(nova.flavor_access.list.call_count, 2)
+        self.assertEqual(sorted(c.args for c in nova.flavor_access.add_tenant_access.call_args_list),
+                         [('private1', 'p2'), ('private2', 'p1'), ('private2', 'p2')])
+
+        # the valid grants are made before the missing flavors are raised, ids are compared as strings
+        nova.flavors.list.return_value = [Mock(id='10', is_public=False)]
+        nova.flavor_access.list.side_effect = lambda flavor: []
+        self.assertRaisesRegex(Exception, 'flavor not found: one/missing', p.seed_project_flavors,
+                               [(p1, ['missing', 10])])
+        nova.flavor_access.add_tenant_access.assert_called_with('10', 'p1')
@@ -0,0 +1,34 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.rbac_policies import Rbac_Policies
+from unittest.mock import patch
+
+
+os = OpenstackHelper({})
+class TestRbacPolicies(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_rbac_policies(self, openstack_mock):
+        openstack_mock.sanitize = os.sanitize
+        openstack_mock.get_project_ids.return_value = {('Default', 'admin'): 'p1', ('Default', 'demo'): 'p2',
+                                                       ('Default', 'other'): 'p3'}
+        openstack_mock.get_network_ids.return_value = {('p1', 'net'): 'n1'}
+        openstack_mock.iter_neutron_resources.return_value = [
+            {'object_id': 'n1', 'action': 'access_as_shared', 'target_tenant': 'p2'}]
+        neutron = openstack_mock.get_neutronclient.return_value
+        r = Rbac_Policies({}, False)
+        r.openstack = openstack_mock
+        self.assertRaisesRegex(Exception, 'not found: missing@admin@Default', r.seed, [
+            {'object_type': 'network', 'object_name': 'net@admin@Default', 'action': 'access_as_shared',
+             'target_tenant_name': 'demo@Default'},
+            {'object_type': 'network', 'object_name': 'net@admin@Default', 'action': 'access_as_shared',
+             'target_tenant_name': 'other@Default'},
+            {'object_type': 'network', 'object_name': 'missing@admin@Default', 'action': 'access_as_shared',
+             'target_tenant_name': 'demo@Default'},
+        ])
+        openstack_mock.get_project_ids.assert_called_once_with(
+            {('Default', 'admin'), ('Default', 'demo'), ('Default', 'other')})
+        openstack_mock.get_network_ids.assert_called_once_with({('p1', 'net'), ('p1', 'missing')})
+        openstack_mock.iter_neutron_resources.assert_called_once_with(
+            'rbac_policies', fields=['object_id', 'action', 'target_tenant'], object_type='network', object_id=['n1'])
+        neutron.create_rbac_policy.assert_called_once_with(body={'rbac_policy': {
+            'object_type': 'network', 'object_id': 'n1', 'action': 'access_as_shared', 'target_tenant': 'p3'}})
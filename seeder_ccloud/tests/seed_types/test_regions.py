@@ -0,0 +1,29 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.regions import Regions
+from unittest.mock import patch
+from keystoneclient.v3.regions import Region
+
+
+os = OpenstackHelper({})
+class TestRegions(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_region_tree(self, openstack_mock):
+        keystone = openstack_mock.get_keystoneclient.return_value
+        keystone.regions.list.return_value = [Region(None, {'id': 'eu', 'description': 'europe', 'parent_region_id': None})]
+        created = []
+        keystone.regions.create.side_effect = lambda **region: created.append(region['id']) or Region(None, region)
+        openstack_mock.sanitize = os.sanitize
+        r = Regions({}, False)
+        r.openstack = openstack_mock
+        r.seed([{'id': 'eu-de-1a', 'parent_region': 'eu-de-1'}, {'id': 'eu-de-1', 'parent_region': 'eu'},
+                {'id': 'eu', 'description': 'europe'}, {'id': 'eu-nl-1', 'parent_region': 'eu'}])
+        self.assertEqual(sorted(created[:2]), ['eu-de-1', 'eu-nl-1'])
+        self.assertEqual(created[2], 'eu-de-1a')
+        keystone.regions.list.assert_called_once_with()
+        keystone.regions.update.assert_not_called()
+
+
+    def test_region_cycle(self):
+        self.assertRaisesRegex(Exception, 'own ancestor', Regions._get_levels,
+                               [{'id': 'a', 'parent_region': 'b'}, {'id': 'b', 'parent_region': 'a'}])
@@ -0,0 +1,24 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.role_inferences import Role_Inferences
+from unittest.mock import patch
+from keystoneclient.v3.roles import InferenceRule
+
+
+os = OpenstackHelper({})
+class TestRoleInferences(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_role_inferences(self, openstack_mock):
+        keystone = openstack_mock.get_keystoneclient.return_value
+        keystone.inference_rules.list_inference_roles.return_value = [InferenceRule(None, {
+            'prior_role': {'id': '1', 'name': 'admin'},
+            'implies': [{'id': '2', 'name': 'member'}, {'id': '3', 'name': 'reader'}]})]
+        openstack_mock.get_role_id.side_effect = lambda name: {'member': '2', 'viewer': '4'}[name]
+        openstack_mock.sanitize = os.sanitize
+        r = Role_Inferences({}, False)
+        r.openstack = openstack_mock
+        r.seed([{'prior_role': 'admin', 'implied_role': 'member'}, {'prior_role': 'admin', 'implied_role': 'reader'},
+                {'prior_role': 'member', 'implied_role': 'viewer'}])
+        keystone.inference_rules.list_inference_roles.assert_called_once_with()
+        keystone.inference_rules.create.assert_called_once_with('2', '4')
+        keystone.inference_rules.get.assert_not_called()
@@ -0,0 +1,35 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.projects.routers import Routers
+from unittest.mock import patch
+
+
+class TestRouters(unittest.TestCase):
+    def setUp(self):
+        OpenstackHelper({}).revision_cache.clear()
+
+
+    @patch.object(OpenstackHelper, 'get_project_id', return_value='p1')
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_router_revision(self, neutron_mock, project_mock):
+        neutron = neutron_mock.return_value
+        neutron.router_path = '/routers/%s'
+        neutron.list_routers.return_value = {'routers': [
+            {'id': 'r1', 'name': 'router', 'admin_state_up': True, 'revision_number': 1}]}
+        r = Routers({}, False)
+        r.seed([{'name': 'router', 'domain': 'Default', 'project': 'admin', 'admin_state_up': True}])
+        neutron.put.assert_not_called()
+
+        # unchanged revision, the attributes are not compared again
+        router = Routers({}, False)
+        with patch.object(OpenstackHelper, 'verify_revision') as verify_mock:
+            router.seed([{'name': 'router', 'domain': 'Default', 'project': 'admin', 'admin_state_up': True}])
+        verify_mock.assert_not_called()
+        neutron.put.assert_not_called()
+
+        neutron.put.return_value = {'router': {'id': 'r1', 'name': 'router', 'admin_state_up': False,
+                                               'revision_number': 2}}
+        r.seed([{'name': 'router', 'domain': 'Default', 'project': 'admin', 'admin_state_up': False}])
+        neutron.put.assert_called_once_with('/routers/r1',
+                                            body={'router': {'name': 'router', 'admin_state_up': False}},
+                                            headers={'If-Match': 'revision_number=1'})
@@ -3,6 +3,7 @@ from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
 from seeder_ccloud.handlers.services import Services
 from unittest.mock import patch
 from keystoneclient.v3.services import Service
+from keystoneclient.v3.endpoints import Endpoint
 
 
 os = OpenstackHelper({})
@@ -42,3 +43,26 @@ class TestServices(unittest.TestCase):
         r.openstack = openstack_mock
         r.seed([{'name': 'service_name', 'description': 'descr', 'type': 'type_name', 'enabled': False}])
         service_mock.services.update.assert_called_once()
+
+
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    @patch('keystoneclient.v3.services.ServiceManager')
+    def test_endpoints(self, openstack_mock, service_mock):
+        svc = Service(None, {'id' :'1', 'name': 'service_name', 'type': 'type_name'})
+        service_mock.services.list.return_value = [svc]
+        service_mock.endpoints.list.return_value = [
+            Endpoint(None, {'id': 'e1', 'service_id': '1', 'interface': 'public', 'region_id': 'eu', 'url': 'https://a'}),
+            Endpoint(None, {'id': 'e2', 'service_id': '1', 'interface': 'internal', 'region_id': 'eu', 'url': 'http://a'})]
+        openstack_mock.get_keystoneclient.return_value = service_mock
+        openstack_mock.sanitize = os.sanitize
+        s = Services({}, False)
+        s.openstack = openstack_mock
+        s.seed([{'name': 'service_name', 'type': 'type_name', 'endpoints': [
+            {'interface': 'public', 'region': 'eu', 'url': 'https://a'},
+            {'interface': 'internal', 'region': 'eu', 'url': 'http://b'},
+            {'interface': 'admin', 'region': 'eu', 'url': 'http://c'}]}])
+        service_mock.services.list.assert_called_once_with()
+        service_mock.endpoints.list.assert_called_once_with()
+        service_mock.endpoints.update.assert_called_once_with('e2', url='http://b')
+        service_mock.endpoints.create.assert_called_once_with('1', interface='admin', region='eu', url='http://c')
+        openstack_mock.invalidate_service_catalog.assert_called_once_with()
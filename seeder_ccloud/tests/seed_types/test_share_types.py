@@ -0,0 +1,42 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.handlers.share_types import Share_Types
+from unittest.mock import patch, Mock
+from manilaclient.v2.share_types import ShareType
+
+
+os = OpenstackHelper({})
+class TestShareTypes(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_share_type_unchanged(self, openstack_mock):
+        manila = Mock()
+        stype = ShareType(manila.share_types, {'id': '1', 'name': 'default',
+                                               'extra_specs': {'driver_handles_share_servers': 'True', 'a': '1'}})
+        manila.share_types.list.return_value = [stype]
+        openstack_mock.get_manilaclient.return_value = manila
+        openstack_mock.sanitize = os.sanitize
+        s = Share_Types({}, False)
+        s.openstack = openstack_mock
+        with patch.object(stype, 'set_keys') as set_keys, patch.object(stype, 'unset_keys') as unset_keys:
+            diffs = s.seed([{'name': 'default', 'specs': {'driver_handles_share_servers': True}, 'extra_specs': {'a': '1'}}])
+        self.assertEqual(diffs, {'default': []})
+        set_keys.assert_not_called()
+        unset_keys.assert_not_called()
+
+
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_share_type_extra_specs_delta(self, openstack_mock):
+        manila = Mock()
+        stype = ShareType(manila.share_types, {'id': '1', 'name': 'default',
+                                               'extra_specs': {'a': '1', 'b': '2', 'c': '3'}})
+        manila.share_types.list.return_value = [stype]
+        openstack_mock.get_manilaclient.return_value = manila
+        openstack_mock.sanitize = os.sanitize
+        s = Share_Types({}, False)
+        s.openstack = openstack_mock
+        with patch.object(stype, 'set_keys') as set_keys, patch.object(stype, 'unset_keys') as unset_keys:
+            diffs = s.seed([{'name': 'default', 'specs': {'a': '1', 'b': '4'}}])
+        self.assertEqual(len(diffs['default']), 2)
+        set_keys.assert_called_once_with({'b': '4'})
+        unset_keys.assert_called_once_with(['c'])
+        self.assertEqual(stype.extra_specs, {'a': '1', 'b': '4'})
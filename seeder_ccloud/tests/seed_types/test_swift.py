@@ -0,0 +1,45 @@
+import unittest
+from seeder_ccloud.handlers.projects.swift import Swift
+from unittest.mock import patch
+import swiftclient
+
+
+class TestSwift(unittest.TestCase):
+    @patch('seeder_ccloud.handlers.projects.swift.swiftclient.Connection')
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_containers(self, openstack_mock, connection_mock):
+        openstack_mock.get_swift_auth.return_value = ('http://swift/AUTH_p1', 'token')
+        conn = connection_mock.return_value
+        conn.url, conn.token = 'http://swift/AUTH_p1', 'token'
+        conn.get_account.return_value = ({}, [{'name': 'plain'}, {'name': 'same'}, {'name': 'changed'}])
+        conn.head_container.side_effect = lambda name: {'x-container-read': '.r:*' if name == 'same' else ''}
+        s = Swift({}, False)
+        s.openstack = openstack_mock
+        read = {'read': '.r:*'}
+        s.seed([{'enabled': True, 'domain': 'Default', 'project': 'admin', 'containers': [
+            {'name': 'plain'}, {'name': 'same', 'metadata': read},
+            {'name': 'changed', 'metadata': read}, {'name': 'new', 'metadata': read}]}])
+        conn.put_container.assert_called_once_with('new', {'x-container-read': '.r:*'})
+        conn.post_container.assert_called_once_with('changed', {'x-container-read': '.r:*'})
+        self.assertEqual(sorted(c.args[0] for c in conn.head_container.call_args_list), ['changed', 'same'])
+        openstack_mock.get_project_id.assert_called_once_with('Default', 'admin')
+
+
+    @patch('seeder_ccloud.handlers.projects.swift.swiftclient.Connection')
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_containers_account_errors(self, openstack_mock, connection_mock):
+        openstack_mock.get_swift_auth.return_value = ('http://swift/AUTH_p1', 'token')
+        conn = connection_mock.return_value
+        conn.url, conn.token = 'http://swift/AUTH_p1', 'token'
+        s = Swift({}, False)
+        s.openstack = openstack_mock
+        seed = {'enabled': True, 'domain': 'Default', 'project': 'admin', 'containers': [{'name': 'new'}]}
+
+        # an account which does not exist yet has no containers
+        conn.get_account.side_effect = swiftclient.ClientException('not found', http_status=404)
+        s.seed([dict(seed)])
+        conn.put_container.assert_called_once_with('new', {})
+
+        conn.get_account.side_effect = swiftclient.ClientException('forbidden', http_status=403)
+        self.assertRaises(swiftclient.ClientException, s.seed, [dict(seed)])
+        conn.put_container.assert_called_once()
@@ -0,0 +1,25 @@
+import unittest
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper
+from seeder_ccloud.openstack.password_fingerprints import PasswordFingerprints
+from seeder_ccloud.handlers.users import Users
+from unittest.mock import patch, Mock
+from keystoneclient.v3.users import User
+
+
+os = OpenstackHelper({})
+class TestUsers(unittest.TestCase):
+    @patch('seeder_ccloud.openstack.openstack_helper')
+    def test_user_password_not_reapplied(self, openstack_mock):
+        keystone = Mock()
+        keystone.users.list.return_value = [User(None, {'id': '1', 'name': 'admin', 'enabled': True})]
+        openstack_mock.get_keystoneclient.return_value = keystone
+        openstack_mock.sanitize = os.sanitize
+        openstack_mock.password_fingerprints = PasswordFingerprints()
+        u = Users({}, False)
+        u.openstack = openstack_mock
+        u.seed([{'name': 'admin', 'domain': 'Default', 'enabled': True, 'password': 'secret'}])
+        keystone.users.update.assert_called_once_with('1', password='secret')
+        u.seed([{'name': 'admin', 'domain': 'Default', 'enabled': True, 'password': 'secret'}])
+        keystone.users.update.assert_called_once_with('1', password='secret')
+        u.seed([{'name': 'admin', 'domain': 'Default', 'enabled': False, 'password': 'changed'}])
+        keystone.users.update.assert_called_with('1', enabled=False, password='changed')
@@ -0,0 +1,321 @@
+import unittest, os, tempfile, threading
+from datetime import timedelta
+from seeder_ccloud.openstack.openstack_helper import OpenstackHelper, ResourceNotFound, PartitionedTTLCache
+from seeder_ccloud.openstack.id_store import IdStore
+from seeder_ccloud.openstack.share_type_catalog import ShareTypeCatalog
+from seeder_ccloud.openstack.volume_type_catalog import VolumeTypeCatalog
+from seeder_ccloud.openstack.password_fingerprints import PasswordFingerprints
+from unittest.mock import patch, Mock, call
+from cinderclient.v3.volume_types import VolumeType
+from keystoneauth1 import exceptions as keystoneauthexceptions
+
+
+class TestOpenstackHelper(unittest.TestCase):
+    def setUp(self):
+        self.os = OpenstackHelper({})
+        self.os.id_cache.clear()
+        self.os.not_found_cache.clear()
+        self.os.restored_ids.clear()
+        self.os.revision_cache.clear()
+        self.os.catalog_cache.clear()
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_role_id_cached(self, keystone_mock):
+        keystone_mock.return_value.roles.list.return_value = [Mock(id='1234')]
+        self.assertEqual(self.os.get_role_id('admin'), '1234')
+        self.assertEqual(self.os.get_role_id('admin'), '1234')
+        keystone_mock.return_value.roles.list.assert_called_once_with(name='admin')
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_role_not_found_cached(self, keystone_mock):
+        keystone_mock.return_value.roles.list.return_value = []
+        self.assertRaisesRegex(ResourceNotFound, 'role admin not found', self.os.get_role_id, 'admin')
+        self.assertRaisesRegex(ResourceNotFound, 'role admin not found', self.os.get_role_id, 'admin')
+        keystone_mock.return_value.roles.list.assert_called_once_with(name='admin')
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_role_id_single_flight(self, keystone_mock):
+        started = threading.Event()
+        release = threading.Event()
+        def list_roles(name):
+            started.set()
+            release.wait(5)
+            return [Mock(id='1234')]
+        keystone_mock.return_value.roles.list.side_effect = list_roles
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.os.get_role_id('admin'))) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(results, ['1234'] * 5)
+        keystone_mock.return_value.roles.list.assert_called_once_with(name='admin')
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_role_id_stored_by_previous_leader(self, keystone_mock):
+        # the id is stored between the cache lookup and taking the lead
+        self.os.id_cache[('role', 'admin')] = '1234'
+        with patch.object(self.os, '_get_cached_id', return_value=None):
+            self.assertEqual(self.os.get_role_id('admin'), '1234')
+        keystone_mock.return_value.roles.list.assert_not_called()
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_role_not_found_invalidated(self, keystone_mock):
+        keystone_mock.return_value.roles.list.return_value = []
+        self.assertRaises(ResourceNotFound, self.os.get_role_id, 'admin')
+        self.os.cache_id('role', 'admin', resource_id='1234')
+        self.assertEqual(self.os.get_role_id('admin'), '1234')
+        keystone_mock.return_value.roles.list.assert_called_once_with(name='admin')
+
+
+    def test_id_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'ids.sqlite')
+            store = IdStore(path)
+            store.put({('project', 'Default', 'admin'): '1234', ('role', 'admin'): '5678'})
+            store.delete([('role', 'admin')])
+            self.assertEqual(IdStore(path).load(timedelta(days=1)), {('project', 'Default', 'admin'): '1234'})
+
+
+    def test_cache_id_writes_changes_only(self):
+        self.os.restored_ids.add(('project', 'Default', 'restored'))
+        self.os.id_cache[('project', 'Default', 'restored')] = '1'
+        with patch.object(self.os, 'id_store') as id_store_mock:
+            self.os.cache_id('project', 'Default', 'admin', resource_id='1234')
+            self.os.cache_id('project', 'Default', 'admin', resource_id='1234')
+            self.os.cache_id('project', 'Default', 'restored', resource_id='1')
+            self.os.cache_id('project', 'Default', 'restored', resource_id='1')
+        self.assertEqual(id_store_mock.put.call_args_list, [
+            call({('project', 'Default', 'admin'): '1234'}), call({('project', 'Default', 'restored'): '1'})])
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_revalidate_restored_ids(self, keystone_mock):
+        self.os.id_cache[('role', 'admin')] = 'stale'
+        self.os.id_cache[('role', 'member')] = 'restored'
+        self.os.restored_ids.update({('role', 'admin'), ('role', 'member')})
+        with patch.object(self.os, 'id_store') as id_store_mock:
+            # a failure which is not a stale id keeps the restored ids
+            with self.assertRaises(ValueError):
+                with self.os.revalidating_restored_ids():
+                    self.os.get_role_id('admin')
+                    raise ValueError()
+            id_store_mock.delete.assert_not_called()
+
+            # only the restored ids used by the failed operation are dropped
+            with self.assertRaises(keystoneauthexceptions.NotFound):
+                with self.os.revalidating_restored_ids():
+                    self.os.get_role_id('admin')
+                    raise keystoneauthexceptions.NotFound()
+            id_store_mock.delete.assert_called_once_with([('role', 'admin')])
+        self.assertEqual(self.os.restored_ids, {('role', 'member')})
+        keystone_mock.return_value.roles.list.return_value = [Mock(id='1234')]
+        self.assertEqual(self.os.get_role_id('admin'), '1234')
+        self.assertEqual(self.os.get_role_id('member'), 'restored')
+
+
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_warm_up_id_cache(self, keystone_mock, neutron_mock):
+        domain = Mock(id='d1')
+        domain.name = 'Default'
+        project = Mock(id='p1')
+        project.name = 'admin'
+        keystone = keystone_mock.return_value
+        keystone.domains.list.return_value = [domain]
+        keystone.roles.list.return_value = []
+        keystone.projects.list.return_value = [project]
+        keystone.groups.list.return_value = []
+        keystone.users.list.return_value = []
+        neutron = neutron_mock.return_value
+        neutron.list_subnetpools.return_value = [{'subnetpools': []}]
+        neutron.list_networks.return_value = [{'networks': [{'id': 'n1', 'name': 'net', 'tenant_id': 'p1'}]}]
+        neutron.list_subnets.return_value = [{'subnets': []}]
+        self.os.warm_up_id_cache()
+        self.assertEqual(self.os.get_domain_id('Default'), 'd1')
+        self.assertEqual(self.os.get_project_id('Default', 'admin'), 'p1')
+        self.assertEqual(self.os.get_network_id('p1', 'net'), 'n1')
+        keystone.projects.list.assert_called_once_with(domain='d1')
+
+
+    def test_partitioned_cache(self):
+        cache = PartitionedTTLCache(maxsize=2, ttl=timedelta(minutes=1))
+        load = Mock(return_value='client')
+        self.assertEqual(cache.get_or_load(('keystone',), load), 'client')
+        self.assertEqual(cache.get_or_load(('keystone',), load), 'client')
+        load.assert_called_once()
+        cache[('project', 'Default', 'admin')] = '1234'
+        self.assertEqual(cache.free('project'), 1)
+        self.assertEqual(cache.free('role'), 2)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.pop(('project', 'Default', 'admin')), '1234')
+        self.assertNotIn(('project', 'Default', 'admin'), cache)
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_get_project_ids(self, keystone_mock):
+        projects = []
+        for i in range(5):
+            project = Mock(id='p{}'.format(i))
+            project.name = 'project{}'.format(i)
+            projects.append(project)
+        keystone = keystone_mock.return_value
+        keystone.domains.list.return_value = [Mock(id='d1')]
+        keystone.projects.list.return_value = projects
+        self.os.cache_id('project', 'Default', 'project0', resource_id='cached')
+        keys = {('Default', 'project0'), ('Default', 'project1'), ('Default', 'project2'),
+                ('Default', 'project3'), ('Default', 'missing')}
+        ids = self.os.get_project_ids(keys)
+        self.assertEqual(ids, {('Default', 'project0'): 'cached', ('Default', 'project1'): 'p1',
+                               ('Default', 'project2'): 'p2', ('Default', 'project3'): 'p3'})
+        keystone.projects.list.assert_called_once_with(domain='d1')
+        self.assertEqual(self.os.get_project_id('Default', 'project2'), 'p2')
+        self.assertRaises(ResourceNotFound, self.os.get_project_id, 'Default', 'missing')
+        keystone.projects.list.assert_called_once_with(domain='d1')
+
+
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_find_neutron_resource(self, neutron_mock):
+        pages = iter([{'networks': [{'id': 'n1'}]}, {'networks': [{'id': 'n2'}]}])
+        neutron_mock.return_value.list_networks.return_value = pages
+        self.assertEqual(self.os.get_network_id('p1', 'net'), 'n1')
+        neutron_mock.return_value.list_networks.assert_called_once_with(
+            retrieve_all=False, limit=1, fields=['id'], tenant_id='p1', name='net')
+        # the second page has not been fetched
+        self.assertEqual(next(pages), {'networks': [{'id': 'n2'}]})
+
+
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_neutron_revisions(self, neutron_mock):
+        neutron = neutron_mock.return_value
+        neutron.network_path = '/networks/%s'
+        neutron.put.return_value = {'network': {'id': 'n1', 'name': 'net', 'revision_number': 4}}
+        seed = {'name': 'net', 'shared': False}
+        resource = {'id': 'n1', 'name': 'net', 'shared': False, 'revision_number': 3}
+        self.assertFalse(self.os.is_revision_verified('network', resource, seed))
+        self.os.verify_revision('network', resource, seed)
+        self.assertTrue(self.os.is_revision_verified('network', resource, seed))
+        self.assertFalse(self.os.is_revision_verified('network', resource, dict(seed, shared=True)))
+
+        resource = self.os.update_neutron_resource('network', resource, {'network': {'shared': True}})
+        neutron.put.assert_called_once_with('/networks/n1', body={'network': {'shared': True}},
+                                            headers={'If-Match': 'revision_number=3'})
+        self.assertFalse(self.os.is_revision_verified('network', resource, seed))
+        self.assertEqual(resource['revision_number'], 4)
+
+
+    @patch('seeder_ccloud.openstack.password_fingerprints.client')
+    def test_password_fingerprints(self, k8s_mock):
+        api = k8s_mock.CoreV1Api.return_value
+        api.read_namespaced_secret.return_value = Mock(data=None)
+        fingerprints = PasswordFingerprints('ns/fingerprints', iterations=10)
+        fingerprints.put('Default', 'u1', 'secret')
+        self.assertTrue(fingerprints.matches('Default', 'u1', 'secret'))
+        self.assertFalse(fingerprints.matches('Default', 'u1', 'changed'))
+        # fingerprints keep their iteration count
+        fingerprints.iterations = 20
+        self.assertTrue(fingerprints.matches('Default', 'u1', 'secret'))
+
+        # the oldest fingerprints are dropped to fit into the secret
+        fingerprints.max_bytes = 1000
+        for i in range(2, 20):
+            fingerprints.put('Default', 'u{}'.format(i), 'secret')
+        fingerprints.save()
+        data = api.patch_namespaced_secret.call_args.args[2]['data']['fingerprints']
+        self.assertLessEqual(len(data), 1000)
+        self.assertFalse(fingerprints.matches('Default', 'u1', 'secret'))
+        self.assertTrue(fingerprints.matches('Default', 'u19', 'secret'))
+
+
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_seed_neutron_tags(self, neutron_mock):
+        neutron = neutron_mock.return_value
+        neutron.network_path = '/networks/%s'
+        resource = {'id': 'n1', 'name': 'net', 'tags': ['b', 'x']}
+        self.assertEqual(self.os.seed_neutron_tags('network', resource, ['a', 'b']), ['a'])
+        neutron.put.assert_called_once_with('/networks/n1/tags', body={'tags': ['a', 'b', 'x']})
+        self.assertEqual(self.os.seed_neutron_tags('network', resource, ['b']), [])
+        self.assertEqual(self.os.seed_neutron_tags('network', resource, ['c'], dry_run=True), ['c'])
+        neutron.put.assert_called_once()
+
+
+    def test_share_type_catalog(self):
+        def share_type(id, is_public):
+            t = Mock(id=id, is_public=is_public)
+            t.name = id
+            return t
+        client = Mock()
+        client.share_types.list.return_value = [share_type('public', True), share_type('t1', False),
+                                                 share_type('t2', False)]
+        client.share_type_access.list.side_effect = lambda t: [Mock(project_id='p1')] if t.id == 't1' else []
+        catalog = ShareTypeCatalog(client)
+        self.assertEqual(catalog.types_of_project('p1'), [catalog.get('t1')])
+        catalog.add_project_access(catalog.get('t2'), 'p1')
+        catalog.remove_project_access(catalog.get('t1'), 'p1')
+        self.assertEqual(catalog.types_of_project('p1'), [catalog.get('t2')])
+        client.share_types.list.assert_called_once()
+        self.assertEqual(client.share_type_access.list.call_count, 2)
+
+
+    def test_volume_type_catalog(self):
+        client = Mock()
+        info = {'id': 'v1', 'name': 'ssd', 'description': 'old', 'extra_specs': {'a': '1'},
+                'is_public': True, 'os-volume-type-access:is_public': True}
+        vtype = VolumeType(client.volume_types, info)
+        client.volume_types.list.return_value = [vtype]
+        client.volume_types.update.return_value = VolumeType(client.volume_types, dict(
+            info, description='new', is_public=False, extra_specs=None, **{'os-volume-type-access:is_public': False}))
+        catalog = VolumeTypeCatalog(client)
+        self.assertEqual(catalog.get_extra_specs(catalog.get('ssd')), {'a': '1'})
+        listed = vtype
+        vtype = catalog.update(listed, description='new', is_public=False)
+        client.volume_types.update.assert_called_once_with(listed, description='new', is_public=False)
+        self.assertIs(catalog.get('ssd'), vtype)
+        self.assertEqual((vtype.description, vtype.is_public), ('new', False))
+        with patch.object(vtype, 'set_keys') as set_keys, patch.object(vtype, 'get_keys') as get_keys:
+            catalog.set_extra_specs(vtype, {'b': '2'})
+            self.assertEqual(catalog.get_extra_specs(vtype), {'a': '1', 'b': '2'})
+        set_keys.assert_called_once_with({'b': '2'})
+        get_keys.assert_not_called()
+        client.volume_types.list.assert_called_once_with(is_public=None)
+
+
+    @patch.object(OpenstackHelper, 'get_keystoneclient')
+    def test_has_service(self, keystone_mock):
+        limes = Mock(id='s1')
+        limes.name = 'limes'
+        keystone_mock.return_value.services.list.return_value = [limes]
+        keystone_mock.return_value.endpoints.list.return_value = []
+        self.assertTrue(self.os.has_service('limes'))
+        self.assertFalse(self.os.has_service('designate'))
+        keystone_mock.return_value.services.list.assert_called_once_with()
+
+
+    @patch.object(OpenstackHelper, 'get_neutronclient')
+    def test_get_network_ids(self, neutron_mock):
+        neutron = neutron_mock.return_value
+        neutron.list_networks.return_value = [{'networks': [
+            {'id': 'n1', 'name': 'net1', 'tenant_id': 'p1'}, {'id': 'n2', 'name': 'net2', 'tenant_id': 'p2'},
+            {'id': 'n3', 'name': 'net1', 'tenant_id': 'p2'}]}]
+        keys = {('p1', 'net1'), ('p2', 'net2'), ('p1', 'net2'), ('p2', 'missing')}
+        self.assertEqual(self.os.get_network_ids(keys), {('p1', 'net1'): 'n1', ('p2', 'net2'): 'n2'})
+        neutron.list_networks.assert_called_once_with(retrieve_all=False, limit=500, fields=['id', 'name', 'tenant_id'],
+                                                      tenant_id=['p1', 'p2'], name=['missing', 'net1', 'net2'])
+        self.assertEqual(self.os.get_network_id('p2', 'net2'), 'n2')
+        self.assertRaises(ResourceNotFound, self.os.get_network_id, 'p2', 'missing')
+        neutron.list_networks.assert_called_once()
+
+        # the listings are chunked
+        neutron.list_networks.reset_mock()
+        neutron.list_networks.return_value = [{'networks': []}]
+        self.os.get_network_ids({('p3', 'net1'), ('p3', 'net2'), ('p4', 'net3'), ('p4', 'net4')}, chunk_size=3)
+        self.assertEqual([c.kwargs['name'] for c in neutron.list_networks.call_args_list],
+                         [['net1', 'net2', 'net3'], ['net4']])
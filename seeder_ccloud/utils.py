@@ -78,6 +78,18 @@ class Config:
         parser.add_argument("--namespace-patterns", dest="namespaces",
                             help="list of namespace patterns. default is cluster wide",
                             default='')
+        parser.add_argument('--id-cache-file', dest='id_cache_file',
+                            help='sqlite file to persist resolved openstack ids across restarts',
+                            default=None)
+        parser.add_argument('--warm-up-id-cache', dest='warm_up_id_cache',
+                            help='fill the id cache from bulk keystone and neutron listings on startup',
+                            default=False, action='store_true')
+        parser.add_argument('--password-fingerprint-secret', dest='password_fingerprint_secret',
+                            help='namespace/name of the secret keeping fingerprints of the seeded user passwords',
+                            default=None)
+        parser.add_argument('--password-fingerprint-iterations', dest='password_fingerprint_iterations',
+                            help='pbkdf2 iterations of new password fingerprints',
+                            default=None, type=int)
         cli.register_argparse_arguments(parser, sys.argv[1:])
         self.args = parser.parse_args()
         return self.args